@@ -0,0 +1 @@
+"""LLMos-Lite API package"""
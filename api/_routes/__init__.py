@@ -0,0 +1,6 @@
+"""
+Routers mounted by api/index.py
+
+Kept in an underscore package so Vercel does not deploy each module as a
+function of its own; every /api/* request reaches them through index.py.
+"""
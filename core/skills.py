@@ -32,8 +32,9 @@ keywords: [python, testing, pytest]
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
 import re
 
 
@@ -84,6 +85,9 @@ class SkillsManager:
     - Supports skill creation and evolution
     """
 
+    # Max memoized (user, team, query, max_skills) filter results
+    FILTER_CACHE_SIZE = 4096
+
     def __init__(self, volume_manager):
         """
         Initialize skills manager.
@@ -92,7 +96,10 @@ class SkillsManager:
             volume_manager: VolumeManager instance
         """
         self.volume_manager = volume_manager
-        self._cache: Dict[str, List[Skill]] = {}
+        self._cache: Dict[Tuple[str, str], List[Skill]] = {}
+        # System skills are read-only and shared by every user
+        self._system_skills: Optional[List[Skill]] = None
+        self._filter_cache: "OrderedDict[Tuple[str, str, str, int], List[Skill]]" = OrderedDict()
 
     def load_skills_for_user(
         self,
@@ -116,7 +123,7 @@ class SkillsManager:
         Returns:
             List of Skill objects
         """
-        cache_key = f"{user_id}:{team_id}"
+        cache_key = (user_id, team_id)
 
         if use_cache and cache_key in self._cache:
             return self._cache[cache_key]
@@ -124,8 +131,7 @@ class SkillsManager:
         skills = []
 
         # 1. System skills (lowest priority, override by team/user)
-        sys_vol = self.volume_manager.get_system_volume(readonly=True)
-        skills.extend(self._load_from_volume(sys_vol, "system"))
+        skills.extend(self._load_system_skills())
 
         # 2. Team skills
         team_vol = self.volume_manager.get_team_volume(team_id, readonly=True)
@@ -140,6 +146,23 @@ class SkillsManager:
 
         return skills
 
+    def warm_up(self) -> int:
+        """
+        Read and parse the system skills ahead of the first request,
+        without touching any team or user volume.
+
+        Returns:
+            Number of system skills parsed
+        """
+        return len(self._load_system_skills())
+
+    def _load_system_skills(self) -> List[Skill]:
+        """Load the system skills, parsing them only once"""
+        if self._system_skills is None:
+            sys_vol = self.volume_manager.get_system_volume(readonly=True)
+            self._system_skills = self._load_from_volume(sys_vol, "system")
+        return self._system_skills
+
     def _load_from_volume(self, volume, volume_type: str) -> List[Skill]:
         """Load all skills from a volume"""
         skills = []
@@ -267,6 +290,35 @@ class SkillsManager:
         scored_skills.sort(key=lambda x: x[1], reverse=True)
         return [s[0] for s in scored_skills[:max_skills]]
 
+    def filter_skills_for_user(
+        self,
+        user_id: str,
+        team_id: str,
+        query: str,
+        max_skills: int = 5
+    ) -> List[Skill]:
+        """
+        Memoized filter_skills_by_query() over a user's skills.
+
+        Results are kept in an LRU keyed by (user_id, team_id, normalized
+        query, max_skills) and dropped together with the skills cache.
+        """
+        key = (user_id, team_id, query.lower().strip(), max_skills)
+
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            self._filter_cache.move_to_end(key)
+            return cached
+
+        all_skills = self.load_skills_for_user(user_id, team_id)
+        skills = self.filter_skills_by_query(all_skills, key[2], max_skills)
+
+        self._filter_cache[key] = skills
+        if len(self._filter_cache) > self.FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+
+        return skills
+
     def create_skill(
         self,
         user_id: str,
@@ -294,9 +346,60 @@ class SkillsManager:
         """
         user_vol = self.volume_manager.get_user_volume(user_id)
 
-        # Format as markdown with frontmatter
+        return user_vol.write_skill(
+            skill_id,
+            self._format_skill(name, category, description, content, keywords),
+            commit_message=f"Create skill: {name}"
+        )
+
+    def create_skills_bulk(self, user_id: str, skills: List[Dict]) -> int:
+        """
+        Create several skills in the user's volume with a single commit.
+
+        Args:
+            user_id: User identifier
+            skills: Dicts with the create_skill() fields (skill_id, name,
+                category, description, content, optional keywords)
+
+        Returns:
+            Number of skills written
+        """
+        user_vol = self.volume_manager.get_user_volume(user_id)
+
+        names = []
+        for spec in skills:
+            written = user_vol.write_skill(
+                spec["skill_id"],
+                self._format_skill(
+                    spec["name"],
+                    spec["category"],
+                    spec["description"],
+                    spec["content"],
+                    spec.get("keywords")
+                )
+            )
+            if written:
+                names.append(spec["name"])
+
+        if names:
+            user_vol.commit_changes(
+                f"Create {len(names)} skills\n\n" + "\n".join(f"- {n}" for n in names),
+                f"{user_id}-cron"
+            )
+
+        return len(names)
+
+    def _format_skill(
+        self,
+        name: str,
+        category: str,
+        description: str,
+        content: str,
+        keywords: List[str] = None
+    ) -> str:
+        """Format a skill as markdown with frontmatter"""
         keywords_str = "[" + ", ".join(keywords or []) + "]"
-        full_content = f"""---
+        return f"""---
 name: {name}
 category: {category}
 description: {description}
@@ -306,12 +409,6 @@ keywords: {keywords_str}
 {content}
 """
 
-        return user_vol.write_skill(
-            skill_id,
-            full_content,
-            commit_message=f"Create skill: {name}"
-        )
-
     def get_skill(
         self,
         user_id: str,
@@ -349,11 +446,8 @@ keywords: {keywords_str}
         Returns:
             Formatted context string for LLM
         """
-        # Load all skills
-        all_skills = self.load_skills_for_user(user_id, team_id)
-
-        # Filter to relevant
-        relevant_skills = self.filter_skills_by_query(all_skills, query, max_skills)
+        # Load and filter to relevant
+        relevant_skills = self.filter_skills_for_user(user_id, team_id, query, max_skills)
 
         # Build context
         if not relevant_skills:
@@ -371,6 +465,22 @@ keywords: {keywords_str}
 
         return "\n".join(context_parts)
 
+    def invalidate_user(self, user_id: str):
+        """Drop cached skills for a user (after their volume changed)"""
+        for key in [k for k in self._cache if k[0] == user_id]:
+            del self._cache[key]
+        for key in [k for k in self._filter_cache if k[0] == user_id]:
+            del self._filter_cache[key]
+
+    def invalidate_team(self, team_id: str):
+        """Drop cached skills for every user of a team (after the team volume changed)"""
+        for key in [k for k in self._cache if k[1] == team_id]:
+            del self._cache[key]
+        for key in [k for k in self._filter_cache if k[1] == team_id]:
+            del self._filter_cache[key]
+
     def clear_cache(self):
         """Clear the skills cache"""
         self._cache.clear()
+        self._filter_cache.clear()
+        self._system_skills = None
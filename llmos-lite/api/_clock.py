@@ -0,0 +1,24 @@
+"""
+Coarse UTC clock for the mock endpoints
+
+Timestamps are only needed to the second, so the formatted string is
+reused until the second changes. It is refreshed lazily on read rather
+than by a background task: a Vercel function is frozen between
+invocations, and a sleeping refresher would hand out stale times after
+a thaw. The leading underscore keeps Vercel from deploying this module
+as a function of its own.
+"""
+import time
+
+_NOW_CACHE = ""
+_NOW_SECOND = -1
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with a trailing Z, at 1-second resolution"""
+    global _NOW_CACHE, _NOW_SECOND
+    second = int(time.time())
+    if second != _NOW_SECOND:
+        _NOW_CACHE = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _NOW_SECOND = second
+    return _NOW_CACHE
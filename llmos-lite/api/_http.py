@@ -0,0 +1,43 @@
+"""
+Shared HTTP helpers for the API modules
+
+The leading underscore keeps Vercel from deploying this module as a
+function of its own.
+"""
+from fastapi import Request, Response
+from typing import Dict, Optional
+import hashlib
+
+
+def make_etag(body: bytes) -> str:
+    """Weak ETag for a serialized response body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def json_response_with_etag(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serve pre-serialized JSON, or 304 if the client already has it.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: JSON bytes to send
+        etag: Precomputed ETag for body; computed here if omitted
+        headers: Extra headers (e.g. Cache-Control) for both outcomes
+    """
+    if etag is None:
+        etag = make_etag(body)
+    headers = {**headers, "ETag": etag} if headers else {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: W/"x" and "x" name the same representation
+        if "*" in candidates or etag in candidates or etag[2:] in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return Response(body, media_type="application/json", headers=headers)
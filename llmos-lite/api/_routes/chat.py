@@ -1,38 +1,17 @@
 """
-Vercel Function: Chat endpoint with OpenRouter proxy
+Chat endpoint with OpenRouter proxy (served through api/index.py)
 """
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import APIRouter, Request, HTTPException
+from fastapi.responses import ORJSONResponse
+from typing import List
 import os
 import json
 import httpx
 from datetime import datetime
 
-app = FastAPI()
+from api._models import ChatRequest
 
-
-class Message(BaseModel):
-    role: str
-    content: str
-
-
-class ChatRequest(BaseModel):
-    user_id: str
-    team_id: str
-    message: str
-    session_id: Optional[str] = None
-    include_skills: bool = True
-    max_skills: int = 5
-    model: Optional[str] = "anthropic/claude-opus-4.5"
-
-
-class ChatResponse(BaseModel):
-    response: str
-    skills_used: List[str]
-    trace_id: str
-    session_id: str
+router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 
 async def call_openrouter(
@@ -70,7 +49,7 @@ async def call_openrouter(
         return data["choices"][0]["message"]["content"]
 
 
-@app.post("/")
+@router.post("")
 async def chat_handler(request: Request):
     """
     Main chat endpoint - proxies to OpenRouter
@@ -89,8 +68,7 @@ async def chat_handler(request: Request):
             )
 
         # Parse request body
-        body = await request.json()
-        chat_req = ChatRequest(**body)
+        chat_req = ChatRequest.model_validate_json(await request.body())
 
         # Override model from header if provided
         model = request.headers.get("X-Model") or chat_req.model
@@ -125,7 +103,7 @@ async def chat_handler(request: Request):
         # For now, just return response
 
         # Return response
-        return JSONResponse({
+        return ORJSONResponse({
             "response": response_text,
             "skills_used": skills_used,
             "trace_id": trace_id,
@@ -139,11 +117,8 @@ async def chat_handler(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/")
+@router.get("")
 async def health_check():
     """Health check endpoint"""
     return {"status": "ok", "service": "chat"}
 
-
-# Vercel expects the FastAPI app to be exported
-handler = app
@@ -0,0 +1 @@
+"""Vercel cron routes"""
@@ -10,31 +10,145 @@ Provides REST API for:
 This replaces the terminal-based interface from the original llmos.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import asyncio
+import orjson
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# `python api/main.py` puts api/ on sys.path instead of the project root;
+# imported as `api.main` (uvicorn api.main:app) the root is already there
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.volumes import VolumeManager, GitVolume
 from core.skills import SkillsManager, Skill
 from core.evolution import EvolutionCron
 from core.workflow import WorkflowEngine
+from api._http import json_response_with_etag
+from api._models import warm_up_models
 from api.workflows import router as workflows_router
 
+VOLUMES_PATH = Path(os.getenv("LLMOS_VOLUMES_PATH", "./volumes"))
+
+
+# Global state, built on first use so importing the app (and hitting the
+# health check) stays cheap on a cold start
+@lru_cache(maxsize=1)
+def get_volume_manager() -> VolumeManager:
+    """Get the shared volume manager"""
+    return VolumeManager(VOLUMES_PATH)
+
+
+@lru_cache(maxsize=1)
+def get_skills_manager() -> SkillsManager:
+    """Get the shared skills manager"""
+    return SkillsManager(get_volume_manager())
+
+
+@lru_cache(maxsize=1)
+def get_workflow_engine() -> WorkflowEngine:
+    """Get the shared workflow engine"""
+    return WorkflowEngine(get_volume_manager())
+
+
+# ============================================================================
+# Startup/Shutdown
+# ============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize system on startup, clean up on shutdown"""
+    print("🚀 LLMos-Lite API starting...")
+    print(f"📁 Volumes path: {VOLUMES_PATH}")
+
+    # Ensure volumes directory exists
+    VOLUMES_PATH.mkdir(parents=True, exist_ok=True)
+
+    # Initialize system volume if needed
+    sys_vol = get_volume_manager().get_system_volume(readonly=False)
+    print(f"✓ System volume initialized: {sys_vol.base_path}")
+
+    # Pay Pydantic's and orjson's first-use cost before the first request
+    warm_up_models({
+        ChatRequest: {"user_id": "", "team_id": "", "message": ""},
+        ChatResponse: {"response": "", "skills_used": [], "trace_id": ""},
+        SkillCreateRequest: {
+            "user_id": "", "skill_id": "", "name": "",
+            "category": "", "description": "", "content": ""
+        },
+        SkillPromoteRequest: {"user_id": "", "team_id": "", "skill_id": "", "reason": ""},
+        EvolutionRequest: {"user_id": "", "team_id": ""},
+        EvolutionResponse: {
+            "status": "", "traces_analyzed": 0, "patterns_detected": 0, "skills_created": 0
+        }
+    })
+    orjson.dumps({"status": "", "skills": [], "total": 0})
+
+    # Parse system skills now rather than on the first /chat
+    get_skills_manager().warm_up()
+
+    yield
+
+    print("👋 LLMos-Lite API shutting down...")
+    workflows_module.flush_pending_saves()
+    get_volume_manager().close()
+
+
 # Initialize FastAPI
 app = FastAPI(
     title="LLMos-Lite API",
     description="Git-backed, Skills-driven LLM Operating System",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+class UnhandledErrorMiddleware:
+    """
+    Report unexpected errors as 500 {"detail": ...}, like HTTPException does.
+
+    Plain ASGI (no BaseHTTPMiddleware) to stay off the per-request path.
+    Added before CORSMiddleware so it runs inside it and the 500 keeps its
+    CORS headers; an exception_handler(Exception) would run outside CORS.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # Too late for a 500 once the status line went out
+            if response_started:
+                raise
+            response = ORJSONResponse({"detail": str(exc)}, status_code=500)
+            await response(scope, receive, send)
+
+
+app.add_middleware(UnhandledErrorMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -44,15 +158,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global state (would use dependency injection in production)
-VOLUMES_PATH = Path(os.getenv("LLMOS_VOLUMES_PATH", "./volumes"))
-volume_manager = VolumeManager(VOLUMES_PATH)
-skills_manager = SkillsManager(volume_manager)
 
-# Initialize workflow engine
+# Workflow endpoints build the engine through the same factory
 from api import workflows as workflows_module
-workflow_engine = WorkflowEngine(volume_manager)
-workflows_module.workflow_engine = workflow_engine
+workflows_module.workflow_engine_factory = get_workflow_engine
 
 # Include workflow router
 app.include_router(workflows_router)
@@ -86,6 +195,20 @@ class SkillCreateRequest(BaseModel):
     keywords: List[str] = []
 
 
+class SkillDefinition(BaseModel):
+    skill_id: str
+    name: str
+    category: str
+    description: str
+    content: str
+    keywords: List[str] = []
+
+
+class SkillBulkCreateRequest(BaseModel):
+    user_id: str
+    skills: List[SkillDefinition]
+
+
 class SkillPromoteRequest(BaseModel):
     user_id: str
     team_id: str
@@ -131,26 +254,42 @@ async def get_llm_response(message: str, context: str = "") -> str:
     return f"[LLM Response to: {message}]\n\nContext skills loaded:\n{context[:200]}..."
 
 
-def format_trace(user_id: str, message: str, response: str, skills: List[Skill]) -> str:
-    """Format a trace as markdown"""
-    return f"""# Execution Trace: {message[:100]}
+TRACE_TEMPLATE = """# Execution Trace: {title}
 
 ## Metadata
 - **User**: {user_id}
-- **Timestamp**: {datetime.now().isoformat()}
+- **Timestamp**: {timestamp}
 - **Success Rating**: 90%
 
 ## Request
 {message}
 
 ## Skills Used
-{', '.join([s.name for s in skills]) if skills else 'None'}
+{skills}
 
 ## Response
 {response}
 """
 
 
+def format_trace(
+    user_id: str,
+    message: str,
+    response: str,
+    skills: List[Skill],
+    timestamp: Optional[datetime] = None
+) -> str:
+    """Format a trace as markdown"""
+    return TRACE_TEMPLATE.format(
+        title=message[:100],
+        user_id=user_id,
+        timestamp=(timestamp or datetime.now()).isoformat(),
+        message=message,
+        skills=', '.join(s.name for s in skills) if skills else 'None',
+        response=response
+    )
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -165,8 +304,12 @@ async def root():
     }
 
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest):
+@app.post("/chat", responses={200: {"model": ChatResponse}})
+async def chat(
+    req: ChatRequest,
+    volume_manager: VolumeManager = Depends(get_volume_manager),
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """
     Main chat endpoint.
 
@@ -184,9 +327,9 @@ async def chat(req: ChatRequest):
         # 2. Load and filter skills
         skills = []
         if req.include_skills:
-            all_skills = skills_manager.load_skills_for_user(req.user_id, req.team_id)
-            skills = skills_manager.filter_skills_by_query(
-                all_skills,
+            skills = skills_manager.filter_skills_for_user(
+                req.user_id,
+                req.team_id,
                 req.message,
                 max_skills=req.max_skills
             )
@@ -200,26 +343,32 @@ async def chat(req: ChatRequest):
         response = await get_llm_response(req.message, context)
 
         # 5. Save trace
-        trace_id = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        trace_content = format_trace(req.user_id, req.message, response, skills)
+        now = datetime.now()
+        trace_id = f"trace_{now:%Y%m%d_%H%M%S}"
+        trace_content = format_trace(req.user_id, req.message, response, skills, now)
         user_vol.write_trace(trace_id, trace_content)
 
-        return ChatResponse(
-            response=response,
-            skills_used=[s.name for s in skills],
-            trace_id=trace_id
-        )
+        return ORJSONResponse({
+            "response": response,
+            "skills_used": [s.name for s in skills],
+            "trace_id": trace_id
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/skills")
-async def list_skills(user_id: str, team_id: str):
+async def list_skills(
+    user_id: str,
+    team_id: str,
+    request: Request,
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """List all skills accessible to a user"""
     try:
         skills = skills_manager.load_skills_for_user(user_id, team_id)
-        return {
+        body = orjson.dumps({
             "total": len(skills),
             "skills": [
                 {
@@ -231,27 +380,35 @@ async def list_skills(user_id: str, team_id: str):
                 }
                 for s in skills
             ]
-        }
+        })
+        return json_response_with_etag(request, body)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/skills/{skill_id}")
-async def get_skill(user_id: str, team_id: str, skill_id: str):
+async def get_skill(
+    user_id: str,
+    team_id: str,
+    skill_id: str,
+    request: Request,
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """Get a specific skill"""
     try:
         skill = skills_manager.get_skill(user_id, team_id, skill_id)
         if not skill:
             raise HTTPException(status_code=404, detail="Skill not found")
 
-        return {
+        body = orjson.dumps({
             "name": skill.name,
             "category": skill.category,
             "description": skill.description,
             "keywords": skill.keywords,
             "content": skill.content,
             "volume": skill.volume
-        }
+        })
+        return json_response_with_etag(request, body)
     except HTTPException:
         raise
     except Exception as e:
@@ -259,7 +416,10 @@ async def get_skill(user_id: str, team_id: str, skill_id: str):
 
 
 @app.post("/skills")
-async def create_skill(req: SkillCreateRequest):
+async def create_skill(
+    req: SkillCreateRequest,
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """Create a new skill in user's volume"""
     try:
         success = skills_manager.create_skill(
@@ -275,8 +435,9 @@ async def create_skill(req: SkillCreateRequest):
         if not success:
             raise HTTPException(status_code=500, detail="Failed to create skill")
 
-        # Clear cache
-        skills_manager.clear_cache()
+        # Only this user's view of the skills changed
+        skills_manager.invalidate_user(req.user_id)
+        workflows_module.invalidate_user(req.user_id)
 
         return {"status": "created", "skill_id": req.skill_id}
 
@@ -284,8 +445,37 @@ async def create_skill(req: SkillCreateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/skills/bulk")
+async def create_skills_bulk(
+    req: SkillBulkCreateRequest,
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
+    """Create several skills in user's volume with a single commit"""
+    try:
+        created = skills_manager.create_skills_bulk(
+            req.user_id,
+            [skill.model_dump() for skill in req.skills]
+        )
+
+        skills_manager.invalidate_user(req.user_id)
+        workflows_module.invalidate_user(req.user_id)
+
+        return {
+            "status": "created",
+            "skills_created": created,
+            "skill_ids": [skill.skill_id for skill in req.skills]
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/skills/promote")
-async def promote_skill(req: SkillPromoteRequest):
+async def promote_skill(
+    req: SkillPromoteRequest,
+    volume_manager: VolumeManager = Depends(get_volume_manager),
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """
     Promote a skill from user → team volume.
 
@@ -305,8 +495,9 @@ async def promote_skill(req: SkillPromoteRequest):
         if not success:
             raise HTTPException(status_code=404, detail="Skill not found or promotion failed")
 
-        # Clear cache
-        skills_manager.clear_cache()
+        # Every member of the team sees the promoted skill
+        skills_manager.invalidate_team(req.team_id)
+        workflows_module.invalidate_team(req.team_id)
 
         return {
             "status": "promoted",
@@ -319,8 +510,13 @@ async def promote_skill(req: SkillPromoteRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/evolve", response_model=EvolutionResponse)
-async def trigger_evolution(req: EvolutionRequest, background_tasks: BackgroundTasks):
+@app.post("/evolve", responses={200: {"model": EvolutionResponse}})
+async def trigger_evolution(
+    req: EvolutionRequest,
+    background_tasks: BackgroundTasks,
+    volume_manager: VolumeManager = Depends(get_volume_manager),
+    skills_manager: SkillsManager = Depends(get_skills_manager)
+):
     """
     Manually trigger evolution for a user.
 
@@ -338,39 +534,55 @@ async def trigger_evolution(req: EvolutionRequest, background_tasks: BackgroundT
         # Run evolution
         result = await evolution_cron.run_user_evolution(req.user_id, req.team_id)
 
-        # Clear skills cache
-        skills_manager.clear_cache()
+        # Evolution only writes to the user's volume
+        skills_manager.invalidate_user(req.user_id)
+        workflows_module.invalidate_user(req.user_id)
 
-        return EvolutionResponse(
-            status=result.get("status", "completed"),
-            traces_analyzed=result.get("traces_analyzed", 0),
-            patterns_detected=result.get("patterns_detected", 0),
-            skills_created=result.get("skills_created", 0)
-        )
+        return ORJSONResponse({
+            "status": result.get("status", "completed"),
+            "traces_analyzed": result.get("traces_analyzed", 0),
+            "patterns_detected": result.get("patterns_detected", 0),
+            "skills_created": result.get("skills_created", 0)
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/volumes/stats")
-async def get_volume_stats(user_id: str, team_id: str):
+async def get_volume_stats(
+    user_id: str,
+    team_id: str,
+    volume_manager: VolumeManager = Depends(get_volume_manager)
+):
     """Get statistics for user/team/system volumes"""
     try:
         user_vol = volume_manager.get_user_volume(user_id)
         team_vol = volume_manager.get_team_volume(team_id, readonly=True)
         system_vol = volume_manager.get_system_volume(readonly=True)
 
-        return {
-            "user": user_vol.get_stats(),
-            "team": team_vol.get_stats(),
-            "system": system_vol.get_stats()
-        }
+        # Each get_stats() is disk + git bound; run them side by side
+        user_stats, team_stats, system_stats = await asyncio.gather(
+            asyncio.to_thread(user_vol.get_stats),
+            asyncio.to_thread(team_vol.get_stats),
+            asyncio.to_thread(system_vol.get_stats)
+        )
+
+        return ORJSONResponse({
+            "user": user_stats,
+            "team": team_stats,
+            "system": system_stats
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/volumes/history")
-async def get_volume_history(user_id: str, limit: int = 10):
+async def get_volume_history(
+    user_id: str,
+    limit: int = 10,
+    volume_manager: VolumeManager = Depends(get_volume_manager)
+):
     """Get Git commit history for user volume"""
     try:
         user_vol = volume_manager.get_user_volume(user_id)
@@ -386,46 +598,62 @@ async def get_volume_history(user_id: str, limit: int = 10):
 
 
 @app.get("/traces")
-async def list_traces(user_id: str, limit: int = 20):
+async def list_traces(
+    user_id: str,
+    limit: int = 20,
+    volume_manager: VolumeManager = Depends(get_volume_manager)
+):
     """List recent traces for a user"""
     try:
         user_vol = volume_manager.get_user_volume(user_id)
-        trace_ids = user_vol.list_traces(limit=limit)
-
-        traces = []
-        for trace_id in trace_ids:
-            content = user_vol.read_trace(trace_id)
-            if content:
-                # Extract basic info
-                lines = content.split('\n')
-                title = lines[0].replace('# Execution Trace: ', '') if lines else trace_id
 
-                traces.append({
-                    "trace_id": trace_id,
-                    "title": title[:100],
-                    "timestamp": trace_id  # Would extract from metadata in production
-                })
+        # Served from the traces index; no trace file is opened here
+        traces = [
+            {
+                "trace_id": entry["trace_id"],
+                "title": entry["title"][:100],
+                "timestamp": entry["timestamp"]
+            }
+            for entry in user_vol.list_trace_summaries(limit=limit)
+        ]
 
-        return {"total": len(traces), "traces": traces}
+        return ORJSONResponse({"total": len(traces), "traces": traces})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/traces/{trace_id}")
-async def get_trace(user_id: str, trace_id: str):
-    """Get a specific trace"""
+async def get_trace(
+    user_id: str,
+    trace_id: str,
+    format: str = "markdown",
+    volume_manager: VolumeManager = Depends(get_volume_manager)
+):
+    """
+    Get a specific trace.
+
+    Streams the raw Markdown file by default; pass format=json for the
+    {"trace_id", "content"} envelope.
+    """
     try:
         user_vol = volume_manager.get_user_volume(user_id)
-        content = user_vol.read_trace(trace_id)
 
-        if not content:
+        if format == "json":
+            content = user_vol.read_trace(trace_id)
+            if not content:
+                raise HTTPException(status_code=404, detail="Trace not found")
+
+            return ORJSONResponse({
+                "trace_id": trace_id,
+                "content": content
+            })
+
+        trace_file = user_vol.trace_path(trace_id)
+        if not trace_file.is_file():
             raise HTTPException(status_code=404, detail="Trace not found")
 
-        return {
-            "trace_id": trace_id,
-            "content": content
-        }
+        return FileResponse(trace_file, media_type="text/markdown")
 
     except HTTPException:
         raise
@@ -433,30 +661,6 @@ async def get_trace(user_id: str, trace_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ============================================================================
-# Startup/Shutdown
-# ============================================================================
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize system on startup"""
-    print("🚀 LLMos-Lite API starting...")
-    print(f"📁 Volumes path: {VOLUMES_PATH}")
-
-    # Ensure volumes directory exists
-    VOLUMES_PATH.mkdir(parents=True, exist_ok=True)
-
-    # Initialize system volume if needed
-    sys_vol = volume_manager.get_system_volume(readonly=False)
-    print(f"✓ System volume initialized: {sys_vol.base_path}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    print("👋 LLMos-Lite API shutting down...")
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,162 +0,0 @@
-"""
-Vercel Function: Skills management endpoint
-"""
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import List, Optional
-import json
-
-app = FastAPI()
-
-
-class Skill(BaseModel):
-    id: str
-    name: str
-    description: str
-    code: str
-    language: str
-    tags: List[str]
-    usage_count: int
-    success_rate: float
-    created_at: str
-    updated_at: str
-
-
-class SkillCreateRequest(BaseModel):
-    name: str
-    description: str
-    code: str
-    language: str
-    tags: List[str] = []
-
-
-@app.get("/")
-async def list_skills():
-    """
-    List all available skills
-
-    TODO: Load from Vercel Blob storage
-    For now, return mock data
-    """
-    mock_skills = [
-        {
-            "id": "skill_001",
-            "name": "quantum_circuit_builder",
-            "description": "Builds quantum circuits with error correction",
-            "code": "def build_circuit(qubits: int) -> str:\n    ...",
-            "language": "python",
-            "tags": ["quantum", "qiskit"],
-            "usage_count": 42,
-            "success_rate": 0.96,
-            "created_at": "2025-12-01T10:00:00Z",
-            "updated_at": "2025-12-10T15:30:00Z"
-        },
-        {
-            "id": "skill_002",
-            "name": "data_analyzer",
-            "description": "Analyzes CSV data and generates insights",
-            "code": "def analyze_data(csv_path: str) -> dict:\n    ...",
-            "language": "python",
-            "tags": ["data", "analysis"],
-            "usage_count": 28,
-            "success_rate": 0.89,
-            "created_at": "2025-12-05T12:00:00Z",
-            "updated_at": "2025-12-08T09:15:00Z"
-        }
-    ]
-
-    return JSONResponse({"skills": mock_skills})
-
-
-@app.get("/{skill_id}")
-async def get_skill(skill_id: str):
-    """
-    Get a specific skill by ID
-
-    TODO: Load from Vercel Blob storage
-    """
-    # Mock response
-    if skill_id == "skill_001":
-        return JSONResponse({
-            "id": "skill_001",
-            "name": "quantum_circuit_builder",
-            "description": "Builds quantum circuits with error correction",
-            "code": """def build_circuit(qubits: int) -> str:
-    from qiskit import QuantumCircuit
-
-    qc = QuantumCircuit(qubits)
-    for i in range(qubits):
-        qc.h(i)
-    qc.measure_all()
-
-    return qc.qasm()
-""",
-            "language": "python",
-            "tags": ["quantum", "qiskit"],
-            "usage_count": 42,
-            "success_rate": 0.96,
-            "created_at": "2025-12-01T10:00:00Z",
-            "updated_at": "2025-12-10T15:30:00Z"
-        })
-
-    raise HTTPException(status_code=404, detail="Skill not found")
-
-
-@app.post("/")
-async def create_skill(skill_req: SkillCreateRequest):
-    """
-    Create a new skill
-
-    TODO: Save to Vercel Blob storage
-    """
-    # Mock response
-    skill_id = f"skill_{hash(skill_req.name) % 1000:03d}"
-
-    return JSONResponse({
-        "id": skill_id,
-        "name": skill_req.name,
-        "description": skill_req.description,
-        "code": skill_req.code,
-        "language": skill_req.language,
-        "tags": skill_req.tags,
-        "usage_count": 0,
-        "success_rate": 0.0,
-        "created_at": "2025-12-13T00:00:00Z",
-        "updated_at": "2025-12-13T00:00:00Z"
-    }, status_code=201)
-
-
-@app.put("/{skill_id}")
-async def update_skill(skill_id: str, skill_req: SkillCreateRequest):
-    """
-    Update an existing skill
-
-    TODO: Update in Vercel Blob storage
-    """
-    return JSONResponse({
-        "id": skill_id,
-        "name": skill_req.name,
-        "description": skill_req.description,
-        "code": skill_req.code,
-        "language": skill_req.language,
-        "tags": skill_req.tags,
-        "usage_count": 42,  # Preserve existing count
-        "success_rate": 0.96,
-        "created_at": "2025-12-01T10:00:00Z",
-        "updated_at": "2025-12-13T00:00:00Z"
-    })
-
-
-@app.delete("/{skill_id}")
-async def delete_skill(skill_id: str):
-    """
-    Delete a skill
-
-    TODO: Delete from Vercel Blob storage
-    """
-    return JSONResponse({"message": f"Skill {skill_id} deleted"})
-
-
-# Vercel expects the FastAPI app to be exported
-handler = app
@@ -8,14 +8,15 @@ Adds REST endpoints for:
 - Saving workflow results as traces
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import List, Dict, Any, Optional, Callable, Tuple, Type
+from dataclasses import dataclass
+import asyncio
+import orjson
+import time
 
 from core.workflow import (
     WorkflowEngine,
@@ -24,21 +25,98 @@ from core.workflow import (
     WorkflowNode,
     WorkflowEdge
 )
+from api._http import make_etag, json_response_with_etag
 
-router = APIRouter(prefix="/workflows", tags=["workflows"])
+router = APIRouter(
+    prefix="/workflows",
+    tags=["workflows"],
+    default_response_class=ORJSONResponse
+)
 
-# Global workflow engine (would be dependency injection in production)
+# Global workflow engine (would be dependency injection in production).
+# Either set directly, or built on first use from workflow_engine_factory.
 workflow_engine: Optional[WorkflowEngine] = None
+workflow_engine_factory: Optional[Callable[[], WorkflowEngine]] = None
 
 
 def get_workflow_engine():
     """Get the global workflow engine"""
     global workflow_engine
+    if workflow_engine is None and workflow_engine_factory is not None:
+        workflow_engine = workflow_engine_factory()
     if workflow_engine is None:
         raise HTTPException(status_code=500, detail="Workflow engine not initialized")
     return workflow_engine
 
 
+@dataclass(frozen=True)
+class CachedSkills:
+    """A user's executable skills as loaded at one point in time"""
+    loaded_at: float
+    skills: List[ExecutableSkill]
+    by_id: Dict[str, ExecutableSkill]
+    catalog_json: bytes  # /skills/executable body
+    catalog_etag: str
+
+
+# Executable skills per (user_id, team_id), along with the finished catalog
+# response. Workflow editing polls these endpoints back to back, so a short
+# TTL spares re-reading every volume (and re-assembling the catalog) on
+# each call.
+SKILLS_CACHE_TTL = 30.0
+_skills_cache: Dict[Tuple[str, str], CachedSkills] = {}
+_skills_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+
+async def _load_cached(
+    engine: WorkflowEngine,
+    user_id: str,
+    team_id: str,
+    refresh: bool = False
+) -> CachedSkills:
+    """
+    Get a user's executable skills, loading them at most once per TTL.
+
+    Args:
+        refresh: Reload even if the cached entry is still fresh
+    """
+    key = (user_id, team_id)
+    lock = _skills_locks.setdefault(key, asyncio.Lock())
+
+    # Concurrent misses for the same key wait for one load instead of each
+    # doing their own
+    async with lock:
+        cached = _skills_cache.get(key)
+        if not refresh and cached and time.monotonic() - cached.loaded_at < SKILLS_CACHE_TTL:
+            return cached
+
+        skills = await engine.load_executable_skills_async(user_id, team_id)
+        # Each skill's entry is encoded once and reused until its file changes
+        catalog_json = b"[" + b",".join(skill.catalog_entry_json() for skill in skills) + b"]"
+
+        cached = CachedSkills(
+            loaded_at=time.monotonic(),
+            skills=skills,
+            by_id={skill.skill_id: skill for skill in skills},
+            catalog_json=catalog_json,
+            catalog_etag=make_etag(catalog_json)
+        )
+        _skills_cache[key] = cached
+        return cached
+
+
+def invalidate_user(user_id: str):
+    """Drop cached executable skills for a user (after their volume changed)"""
+    for key in [k for k in _skills_cache if k[0] == user_id]:
+        del _skills_cache[key]
+
+
+def invalidate_team(team_id: str):
+    """Drop cached executable skills for every user of a team"""
+    for key in [k for k in _skills_cache if k[1] == team_id]:
+        del _skills_cache[key]
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -66,7 +144,7 @@ class WorkflowCreateRequest(BaseModel):
     description: str
     nodes: List[Dict[str, Any]]
     edges: List[Dict[str, Any]]
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class WorkflowExecuteRequest(BaseModel):
@@ -78,82 +156,212 @@ class WorkflowExecuteRequest(BaseModel):
     edges: List[Dict[str, Any]]
 
 
+def _unvalidated_body(model: Type[BaseModel], raw_fields: Tuple[str, ...] = ("nodes", "edges")):
+    """
+    Dependency that builds `model` from the raw JSON body, validating
+    every field except `raw_fields`.
+
+    nodes/edges are List[Dict[str, Any]]: validating them only re-walks
+    every dict, and the handlers index into them anyway. They are checked
+    to be lists of objects and attached as-is (_build_nodes_edges() reports
+    missing keys); the remaining fields go through normal validation, so
+    missing fields and wrong types are rejected with 422.
+    """
+    async def parse(request: Request) -> BaseModel:
+        try:
+            data = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=422, detail="Request body is not valid JSON")
+
+        if not isinstance(data, dict):
+            raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+
+        raw = {}
+        errors = []
+        for name in raw_fields:
+            value = data.get(name)
+            if not isinstance(value, list):
+                errors.append({
+                    "type": "missing" if name not in data else "list_type",
+                    "loc": ("body", name),
+                    "msg": "Field required" if name not in data else "Input should be a valid list",
+                    "input": value
+                })
+            else:
+                errors.extend(
+                    {
+                        "type": "dict_type",
+                        "loc": ("body", name, i),
+                        "msg": "Input should be a valid dictionary",
+                        "input": item
+                    }
+                    for i, item in enumerate(value)
+                    if not isinstance(item, dict)
+                )
+            raw[name] = value
+
+        try:
+            req = model.model_validate({**data, **{name: [] for name in raw_fields}})
+        except ValidationError as e:
+            errors.extend({**err, "loc": ("body", *err["loc"])} for err in e.errors())
+
+        if errors:
+            raise RequestValidationError(errors)
+
+        for name, value in raw.items():
+            setattr(req, name, value)
+        return req
+
+    return parse
+
+
+def _body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a body read by _unvalidated_body()"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
+# Workflows waiting to be written, per (user_id, workflow_id). The editor
+# saves in quick bursts; only the last version of a burst reaches the volume.
+SAVE_DEBOUNCE_SECONDS = 1.0
+_pending_saves: Dict[Tuple[str, str], Workflow] = {}
+
+
+async def _save_after_debounce(engine: WorkflowEngine, key: Tuple[str, str]):
+    """Background task: write the latest pending version of a workflow"""
+    await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+
+    # A later save of the same workflow may already have written it
+    workflow = _pending_saves.pop(key, None)
+    if workflow is None:
+        return
+
+    if not await asyncio.to_thread(engine.save_workflow, key[0], workflow):
+        print(f"Warning: Could not save workflow {key[1]} for {key[0]}")
+
+
+def flush_pending_saves():
+    """Write every queued workflow now (e.g. on shutdown)"""
+    if not _pending_saves:
+        return
+
+    engine = get_workflow_engine()
+    while _pending_saves:
+        (user_id, workflow_id), workflow = _pending_saves.popitem()
+        if not engine.save_workflow(user_id, workflow):
+            print(f"Warning: Could not save workflow {workflow_id} for {user_id}")
+
+
+def _build_nodes_edges(
+    nodes_raw: List[Dict[str, Any]],
+    edges_raw: List[Dict[str, Any]]
+) -> Tuple[List[WorkflowNode], List[WorkflowEdge]]:
+    """
+    Build workflow nodes and edges from the editor's camelCase JSON.
+
+    Raises:
+        RequestValidationError: A node or edge lacks a required key
+    """
+    nodes = []
+    edges = []
+    errors = []
+
+    for i, node in enumerate(nodes_raw):
+        try:
+            nodes.append(WorkflowNode(
+                node_id=node["nodeId"],
+                skill_id=node["skillId"],
+                position=node["position"],
+                input_values=node.get("inputValues", {})
+            ))
+        except KeyError as e:
+            errors.append(_missing_key_error("nodes", i, e.args[0], node))
+
+    for i, edge in enumerate(edges_raw):
+        try:
+            edges.append(WorkflowEdge(
+                edge_id=edge["edgeId"],
+                source_node_id=edge["source"],
+                source_output=edge["sourceOutput"],
+                target_node_id=edge["target"],
+                target_input=edge["targetInput"]
+            ))
+        except KeyError as e:
+            errors.append(_missing_key_error("edges", i, e.args[0], edge))
+
+    if errors:
+        raise RequestValidationError(errors)
+
+    return nodes, edges
+
+
+def _missing_key_error(field: str, index: int, key: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    """422 error entry for a node/edge missing `key`"""
+    return {"type": "missing", "loc": ("body", field, index, key), "msg": "Field required", "input": item}
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
 
-@router.get("/skills/executable", response_model=List[ExecutableSkillResponse])
-async def list_executable_skills(user_id: str, team_id: str):
+# Fixed parts of the /execute response around the encoded payload
+EXECUTE_PREFIX = b'{"status":"ready","payload":'
+EXECUTE_SUFFIX = b',"execution_mode":"browser-wasm"}'
+
+
+# Body is pre-encoded; the model only documents it in the OpenAPI schema
+@router.get(
+    "/skills/executable",
+    responses={200: {"model": List[ExecutableSkillResponse]}}
+)
+async def list_executable_skills(
+    user_id: str,
+    team_id: str,
+    request: Request,
+    engine: WorkflowEngine = Depends(get_workflow_engine)
+):
     """
     List all executable skills (nodes) available to a user.
 
     These are skills that can be used as nodes in workflows.
     Returns only skills with the executable format (inputs/outputs/code).
     """
-    try:
-        engine = get_workflow_engine()
-        skills = engine.load_executable_skills(user_id, team_id)
-
-        return [
-            ExecutableSkillResponse(
-                skill_id=skill.skill_id,
-                name=skill.name,
-                description=skill.description,
-                node_type=skill.node_type.value,
-                execution_mode=skill.execution_mode.value,
-                category=skill.category,
-                tags=skill.tags,
-                inputs=[
-                    {
-                        "name": inp.name,
-                        "type": inp.type,
-                        "description": inp.description,
-                        "default": inp.default,
-                        "required": inp.required
-                    }
-                    for inp in skill.inputs
-                ],
-                outputs=[
-                    {
-                        "name": out.name,
-                        "type": out.type,
-                        "description": out.description
-                    }
-                    for out in skill.outputs
-                ],
-                estimated_time_ms=skill.estimated_time_ms,
-                memory_mb=skill.memory_mb
-            )
-            for skill in skills
-        ]
+    cached = await _load_cached(engine, user_id, team_id)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response_with_etag(request, cached.catalog_json, cached.catalog_etag)
 
 
 @router.get("/skills/executable/{skill_id}")
-async def get_executable_skill(skill_id: str, user_id: str, team_id: str):
+async def get_executable_skill(
+    skill_id: str,
+    user_id: str,
+    team_id: str,
+    engine: WorkflowEngine = Depends(get_workflow_engine)
+):
     """Get details of a specific executable skill"""
-    try:
-        engine = get_workflow_engine()
+    cached = await _load_cached(engine, user_id, team_id)
 
-        # Load all skills to populate cache
-        engine.load_executable_skills(user_id, team_id)
+    # Hit: a dict lookup. Miss: the skill may be newer than the cached
+    # entry, so reload once before giving up.
+    skill = cached.by_id.get(skill_id)
+    if not skill:
+        cached = await _load_cached(engine, user_id, team_id, refresh=True)
+        skill = cached.by_id.get(skill_id)
+    if not skill:
+        raise HTTPException(status_code=404, detail="Skill not found")
 
-        skill = engine.get_skill(skill_id)
-        if not skill:
-            raise HTTPException(status_code=404, detail="Skill not found")
+    return Response(skill.browser_payload_json(), media_type="application/json")
 
-        return skill.to_browser_payload()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/execute")
-async def prepare_workflow_for_execution(req: WorkflowExecuteRequest):
+@router.post("/execute", openapi_extra=_body_schema(WorkflowExecuteRequest))
+async def prepare_workflow_for_execution(
+    req: WorkflowExecuteRequest = Depends(_unvalidated_body(WorkflowExecuteRequest)),
+    engine: WorkflowEngine = Depends(get_workflow_engine)
+):
     """
     Prepare a workflow for browser execution.
 
@@ -168,121 +376,91 @@ async def prepare_workflow_for_execution(req: WorkflowExecuteRequest):
     3. Execute nodes topologically
     4. Render results
     """
-    try:
-        engine = get_workflow_engine()
-
-        # Load skills to populate cache
-        engine.load_executable_skills(req.user_id, req.team_id)
-
-        # Construct workflow object
-        nodes = [
-            WorkflowNode(
-                node_id=n["nodeId"],
-                skill_id=n["skillId"],
-                position=n["position"],
-                input_values=n.get("inputValues", {})
-            )
-            for n in req.nodes
-        ]
-
-        edges = [
-            WorkflowEdge(
-                edge_id=e["edgeId"],
-                source_node_id=e["source"],
-                source_output=e["sourceOutput"],
-                target_node_id=e["target"],
-                target_input=e["targetInput"]
-            )
-            for e in req.edges
-        ]
-
-        workflow = Workflow(
-            workflow_id=req.workflow_id,
-            name="Runtime Workflow",
-            description="Workflow prepared for browser execution",
-            nodes=nodes,
-            edges=edges
-        )
-
-        # Prepare for browser
-        payload = engine.prepare_for_browser(workflow)
-
-        return {
-            "status": "ready",
-            "payload": payload,
-            "execution_mode": "browser-wasm"
-        }
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/save")
-async def save_workflow(req: WorkflowCreateRequest):
+    # Construct workflow object
+    nodes, edges = _build_nodes_edges(req.nodes, req.edges)
+
+    # This user's skills; reload once if a node names one not seen yet
+    cached = await _load_cached(engine, req.user_id, req.team_id)
+    if any(node.skill_id not in cached.by_id for node in nodes):
+        cached = await _load_cached(engine, req.user_id, req.team_id, refresh=True)
+
+    workflow = Workflow(
+        workflow_id=req.workflow_id,
+        name="Runtime Workflow",
+        description="Workflow prepared for browser execution",
+        nodes=nodes,
+        edges=edges
+    )
+
+    # Prepare for browser; the payload carries every node's code, so it
+    # goes straight into the envelope as already-encoded JSON
+    payload = engine.prepare_for_browser_json(workflow, cached.by_id)
+    body = EXECUTE_PREFIX + payload + EXECUTE_SUFFIX
+    return Response(body, media_type="application/json")
+
+
+@router.post(
+    "/save",
+    status_code=202,
+    openapi_extra=_body_schema(WorkflowCreateRequest)
+)
+async def save_workflow(
+    background_tasks: BackgroundTasks,
+    req: WorkflowCreateRequest = Depends(_unvalidated_body(WorkflowCreateRequest)),
+    engine: WorkflowEngine = Depends(get_workflow_engine)
+):
     """
     Save a workflow to user's volume.
 
-    Stores the workflow as a Markdown file in Git.
+    Stores the workflow as a Markdown file in Git. The write happens after
+    the response (202); saves of the same workflow arriving within
+    SAVE_DEBOUNCE_SECONDS of each other are written once, latest wins.
     """
-    try:
-        engine = get_workflow_engine()
-
-        # Construct workflow
-        nodes = [
-            WorkflowNode(
-                node_id=n["nodeId"],
-                skill_id=n["skillId"],
-                position=n["position"],
-                input_values=n.get("inputValues", {})
-            )
-            for n in req.nodes
-        ]
-
-        edges = [
-            WorkflowEdge(
-                edge_id=e["edgeId"],
-                source_node_id=e["source"],
-                source_output=e["sourceOutput"],
-                target_node_id=e["target"],
-                target_input=e["targetInput"]
-            )
-            for e in req.edges
-        ]
-
-        workflow = Workflow(
-            workflow_id=req.workflow_id,
-            name=req.name,
-            description=req.description,
-            nodes=nodes,
-            edges=edges,
-            metadata=req.metadata
-        )
+    # Construct workflow
+    nodes, edges = _build_nodes_edges(req.nodes, req.edges)
+
+    workflow = Workflow(
+        workflow_id=req.workflow_id,
+        name=req.name,
+        description=req.description,
+        nodes=nodes,
+        edges=edges,
+        metadata=req.metadata
+    )
+
+    # Queue the save; an already pending one for this workflow is replaced
+    key = (req.user_id, req.workflow_id)
+    _pending_saves[key] = workflow
+    background_tasks.add_task(_save_after_debounce, engine, key)
 
-        # Save to volume
-        success = engine.save_workflow(req.user_id, workflow)
-
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to save workflow")
+    return {
+        "status": "queued",
+        "workflow_id": req.workflow_id
+    }
 
-        return {
-            "status": "saved",
-            "workflow_id": req.workflow_id
-        }
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+# Fixed list, encoded once. A fresh Response is still built per request:
+# middleware (CORS) edits response headers in place.
+CATEGORIES_BODY = orjson.dumps({
+    "categories": [
+        {"id": "quantum", "name": "Quantum Computing", "icon": "⚛️"},
+        {"id": "3d-graphics", "name": "3D Graphics", "icon": "🎨"},
+        {"id": "electronics", "name": "Electronics", "icon": "⚡"},
+        {"id": "data-science", "name": "Data Science", "icon": "📊"},
+        {"id": "coding", "name": "Code Generation", "icon": "💻"},
+        {"id": "general", "name": "General", "icon": "🔧"}
+    ]
+})
+CATEGORIES_ETAG = make_etag(CATEGORIES_BODY)
+CATEGORIES_HEADERS = {"Cache-Control": "public, max-age=86400"}
 
 
 @router.get("/categories")
-async def list_skill_categories():
+async def list_skill_categories(request: Request):
     """List all skill categories for filtering"""
-    return {
-        "categories": [
-            {"id": "quantum", "name": "Quantum Computing", "icon": "⚛️"},
-            {"id": "3d-graphics", "name": "3D Graphics", "icon": "🎨"},
-            {"id": "electronics", "name": "Electronics", "icon": "⚡"},
-            {"id": "data-science", "name": "Data Science", "icon": "📊"},
-            {"id": "coding", "name": "Code Generation", "icon": "💻"},
-            {"id": "general", "name": "General", "icon": "🔧"}
-        ]
-    }
+    return json_response_with_etag(
+        request,
+        CATEGORIES_BODY,
+        CATEGORIES_ETAG,
+        headers=CATEGORIES_HEADERS
+    )
@@ -315,7 +315,8 @@ class EvolutionCron:
         """
         Run evolution for a user.
 
-        Analyzes user's traces and generates draft skills.
+        Analyzes user's traces and generates draft skills. All skills created
+        in one run are committed together.
 
         Args:
             user_id: User identifier
@@ -347,26 +348,32 @@ class EvolutionCron:
         ]
 
         # 4. Generate skills from patterns
-        skills_created = 0
+        sections = []
         for pattern in viable_patterns:
             skill_draft = await self.skill_generator.generate_skill_from_pattern(pattern)
 
-            # Save as skill in user volume
+            # Save as skill in user volume (committed below)
             success = user_vol.write_skill(
                 skill_draft.skill_id,
-                self._format_skill(skill_draft),
-                commit_message=f"Evolution: Create skill '{skill_draft.name}' from {pattern.count} traces"
+                self._format_skill(skill_draft)
             )
 
             if success:
-                skills_created += 1
+                sections.append(self._format_commit_section(skill_draft, pattern))
+
+        # 5. One commit for the whole run
+        if sections:
+            user_vol.commit_changes(
+                f"Evolution: Create {len(sections)} skill(s) from traces\n\n" + "\n\n".join(sections),
+                f"{user_id}-cron"
+            )
 
         return {
             "status": "completed",
             "traces_analyzed": len(traces),
             "patterns_detected": len(patterns),
             "viable_patterns": len(viable_patterns),
-            "skills_created": skills_created
+            "skills_created": len(sections)
         }
 
     async def run_team_evolution(self, team_id: str) -> Dict:
@@ -402,23 +409,37 @@ class EvolutionCron:
             all_patterns.extend(patterns)
 
         # Generate team skills
-        skills_created = 0
+        sections = []
         for pattern in all_patterns:
             if pattern.count >= 5:  # Higher threshold for team skills
                 skill_draft = await self.skill_generator.generate_skill_from_pattern(pattern)
 
                 team_vol.write_skill(
                     skill_draft.skill_id,
-                    self._format_skill(skill_draft),
-                    commit_message=f"Team Evolution: {skill_draft.name}"
+                    self._format_skill(skill_draft)
                 )
-                skills_created += 1
+                sections.append(self._format_commit_section(skill_draft, pattern))
+        skills_created = len(sections)
+
+        # One commit for the whole run
+        if sections:
+            team_vol.commit_changes(
+                f"Team Evolution: Create {skills_created} skill(s)\n\n" + "\n\n".join(sections),
+                f"{team_id}-cron"
+            )
 
         return {
             "status": "completed",
             "team_skills_created": skills_created
         }
 
+    def _format_commit_section(self, draft: SkillDraft, pattern: Pattern) -> str:
+        """Format one created skill as a section of the evolution commit message"""
+        return f"""## Pattern: {pattern.description}
+- Occurrences: {pattern.count}
+- Success rate: {pattern.success_rate:.0%}
+- Action: Created skill '{draft.name}'"""
+
     def _format_skill(self, draft: SkillDraft) -> str:
         """Format skill draft as markdown with frontmatter"""
         keywords_str = "[" + ", ".join(draft.keywords) + "]"
@@ -15,11 +15,15 @@ Volume Hierarchy:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from collections import OrderedDict
 import json
+import os
 import subprocess
+import orjson
+import threading
 
 
 class VolumeType(Enum):
@@ -36,6 +40,14 @@ class ArtifactType(Enum):
     MEMORY = "memory"
 
 
+# Volumes with a running `git cat-file --batch` worker, least recently
+# used first. VolumeManager keeps volumes for the life of the process, so
+# the number of live workers is capped instead of growing with every user
+# and team that was ever touched.
+_cat_file_volumes: "OrderedDict[GitVolume, None]" = OrderedDict()
+_cat_file_volumes_lock = threading.Lock()
+
+
 class GitVolume:
     """
     A Git-backed volume for storing skills and traces.
@@ -46,9 +58,14 @@ class GitVolume:
         traces/           # Execution history
         memory/           # Consolidated memory/context
         .git/             # Git repository
+        .gitignore        # Keeps traces_index.jsonl* out of Git
         metadata.json     # Volume metadata
+        traces_index.jsonl  # Derived trace summaries (untracked)
     """
 
+    # Max `git cat-file --batch` workers kept alive across all volumes
+    MAX_CAT_FILE_WORKERS = 16
+
     def __init__(
         self,
         volume_type: VolumeType,
@@ -66,6 +83,16 @@ class GitVolume:
         self.traces_path = self.base_path / "traces"
         self.memory_path = self.base_path / "memory"
         self.metadata_path = self.base_path / "metadata.json"
+        self.gitignore_path = self.base_path / ".gitignore"
+        self.traces_index_path = self.base_path / "traces_index.jsonl"
+
+        # Long-running `git cat-file --batch` worker (started on first use)
+        self._cat_file_proc: Optional[subprocess.Popen] = None
+        self._cat_file_lock = threading.Lock()
+
+        # Serializes index appends and rebuilds (saves write traces from a
+        # worker thread while /chat appends from the event loop)
+        self._traces_index_lock = threading.Lock()
 
         # Initialize
         self._ensure_structure()
@@ -76,6 +103,16 @@ class GitVolume:
         for path in [self.skills_path, self.traces_path, self.memory_path]:
             path.mkdir(parents=True, exist_ok=True)
 
+        # The traces index is rebuilt from traces/ on demand; keep it out of
+        # commit_changes() (`git add .`) so /chat doesn't churn the history
+        # (the pattern also covers the temp file of a rebuild)
+        pattern = self.traces_index_path.name + "*"
+        ignore = self.gitignore_path.read_text() if self.gitignore_path.exists() else ""
+        if pattern not in ignore.splitlines():
+            if ignore and not ignore.endswith("\n"):
+                ignore += "\n"
+            self.gitignore_path.write_text(ignore + pattern + "\n")
+
         # Create metadata if not exists
         if not self.metadata_path.exists():
             self._save_metadata({
@@ -186,9 +223,13 @@ class GitVolume:
 
         return [f.stem for f in traces]
 
+    def trace_path(self, trace_id: str) -> Path:
+        """Path of a trace's Markdown file (may not exist)"""
+        return self.traces_path / f"{trace_id}.md"
+
     def read_trace(self, trace_id: str) -> Optional[str]:
         """Read a trace's content"""
-        trace_file = self.traces_path / f"{trace_id}.md"
+        trace_file = self.trace_path(trace_id)
         if trace_file.exists():
             return trace_file.read_text()
         return None
@@ -200,6 +241,11 @@ class GitVolume:
 
         trace_file = self.traces_path / f"{trace_id}.md"
         trace_file.write_text(content)
+
+        if not self.traces_index_path.exists():
+            self._rebuild_traces_index()
+        else:
+            self._append_traces_index(trace_id, content)
         return True
 
     def delete_trace(self, trace_id: str) -> bool:
@@ -210,9 +256,84 @@ class GitVolume:
         trace_file = self.traces_path / f"{trace_id}.md"
         if trace_file.exists():
             trace_file.unlink()
+            self._rebuild_traces_index()
             return True
         return False
 
+    def list_trace_summaries(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        List trace summaries (trace_id, title, timestamp), newest first.
+
+        Reads only the traces index, so no trace body is opened. A missing
+        index, or one with a torn/corrupt line, is rebuilt from the traces.
+        """
+        if not self.traces_index_path.exists():
+            if self.readonly:
+                return self._scan_trace_summaries(limit)
+            return self._rebuild_traces_index()[:limit]
+
+        summaries = []
+        seen = set()
+        lines = self.traces_index_path.read_bytes().splitlines()
+        for line in reversed(lines):
+            if not line:
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                if self.readonly:
+                    return self._scan_trace_summaries(limit)
+                return self._rebuild_traces_index()[:limit]
+            if entry["trace_id"] in seen:
+                continue
+            seen.add(entry["trace_id"])
+            summaries.append(entry)
+            if limit and len(summaries) >= limit:
+                break
+
+        return summaries
+
+    def _trace_summary(self, trace_id: str, content: str, timestamp: str) -> Dict:
+        """Build the index entry for a trace"""
+        first_line = content.split('\n', 1)[0]
+        title = first_line.replace('# Execution Trace: ', '') if first_line else trace_id
+        return {"trace_id": trace_id, "title": title, "timestamp": timestamp}
+
+    def _append_traces_index(self, trace_id: str, content: str):
+        """Append a trace to the index (later entries win over earlier ones)"""
+        entry = self._trace_summary(trace_id, content, datetime.now().isoformat())
+        with self._traces_index_lock:
+            with open(self.traces_index_path, 'ab') as f:
+                f.write(orjson.dumps(entry) + b"\n")
+
+    def _scan_trace_summaries(self, limit: Optional[int] = None) -> List[Dict]:
+        """Build trace summaries by reading every trace file, newest first"""
+        summaries = []
+        for trace_id in self.list_traces(limit=limit):
+            trace_file = self.traces_path / f"{trace_id}.md"
+            timestamp = datetime.fromtimestamp(trace_file.stat().st_mtime).isoformat()
+            summaries.append(self._trace_summary(trace_id, trace_file.read_text(), timestamp))
+        return summaries
+
+    def _rebuild_traces_index(self) -> List[Dict]:
+        """
+        Rewrite the traces index from the trace files on disk.
+
+        The new index is written next to the old one and swapped in, so
+        readers never see a half-written file.
+
+        Returns:
+            The trace summaries, newest first
+        """
+        tmp_path = self.traces_index_path.with_name(self.traces_index_path.name + ".tmp")
+        with self._traces_index_lock:
+            summaries = self._scan_trace_summaries()
+            with open(tmp_path, 'wb') as f:
+                for entry in reversed(summaries):
+                    f.write(orjson.dumps(entry) + b"\n")
+            os.replace(tmp_path, self.traces_index_path)
+        return summaries
+
     # =========================================================================
     # GIT OPERATIONS
     # =========================================================================
@@ -241,30 +362,135 @@ class GitVolume:
             pass
 
     def get_git_log(self, limit: int = 10) -> List[Dict]:
-        """Get recent Git commits"""
+        """
+        Get recent Git commits.
+
+        Walks first parents from HEAD through the cat-file worker, so no
+        `git log` process is spawned per call.
+        """
+        commits = []
+        rev = "HEAD"
         try:
-            result = subprocess.run(
-                ["git", "log", f"-{limit}", "--pretty=format:%H|%an|%at|%s"],
-                cwd=self.base_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            while rev and len(commits) < limit:
+                obj = self._cat_file(rev)
+                if obj is None or obj[1] != "commit":
+                    break
+                hash_val, _, raw = obj
+
+                headers, _, message = raw.decode('utf-8', 'replace').partition('\n\n')
+                rev = None
+                author = ""
+                timestamp = 0
+                for line in headers.split('\n'):
+                    if line.startswith('parent ') and rev is None:
+                        rev = line[len('parent '):]
+                    elif line.startswith('author '):
+                        ident, _, date = line[len('author '):].rpartition('> ')
+                        author = ident.rsplit(' <', 1)[0]
+                        timestamp = int(date.split()[0])
+
+                commits.append({
+                    "hash": hash_val,
+                    "author": author,
+                    "timestamp": timestamp,
+                    # Same as %s: the first paragraph on one line
+                    "message": message.split('\n\n', 1)[0].strip().replace('\n', ' ')
+                })
+        except (OSError, ValueError):
+            pass
 
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    hash_val, author, timestamp, message = line.split('|', 3)
-                    commits.append({
-                        "hash": hash_val,
-                        "author": author,
-                        "timestamp": int(timestamp),
-                        "message": message
-                    })
-
-            return commits
-        except subprocess.CalledProcessError:
-            return []
+        return commits
+
+    def _cat_file(self, rev: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read a Git object through the volume's `git cat-file --batch` worker.
+
+        A worker that fails mid-read is killed, so the next call starts a
+        fresh one instead of reading the rest of the previous answer.
+
+        Returns:
+            (object hash, object type, content), or None if rev is missing
+        """
+        with self._cat_file_lock:
+            if self._cat_file_proc is not None and self._cat_file_proc.poll() is not None:
+                self._stop_cat_file(kill=True)
+            proc = self._cat_file_proc
+            if proc is None:
+                proc = self._cat_file_proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.base_path,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+
+            try:
+                proc.stdin.write(rev.encode() + b"\n")
+                proc.stdin.flush()
+
+                # "<hash> <type> <size>\n<content>\n", or "<rev> missing\n"
+                line = proc.stdout.readline()
+                if not line:
+                    raise OSError("git cat-file worker exited")
+                header = line.split()
+                if len(header) != 3:
+                    obj = None
+                else:
+                    size = int(header[2])
+                    content = proc.stdout.read(size)
+                    if len(content) != size or proc.stdout.read(1) != b"\n":
+                        raise OSError("git cat-file worker returned a partial object")
+                    obj = header[0].decode(), header[1].decode(), content
+            except Exception:
+                self._stop_cat_file(kill=True)
+                raise
+
+        self._track_cat_file_worker()
+        return obj
+
+    def _track_cat_file_worker(self):
+        """Mark this volume's worker as recently used; stop the oldest over the cap"""
+        idle = []
+        with _cat_file_volumes_lock:
+            _cat_file_volumes[self] = None
+            _cat_file_volumes.move_to_end(self)
+            while len(_cat_file_volumes) > self.MAX_CAT_FILE_WORKERS:
+                idle.append(_cat_file_volumes.popitem(last=False)[0])
+
+        # Outside the registry lock: close() takes each volume's own lock
+        for volume in idle:
+            volume.close()
+
+    def _stop_cat_file(self, kill: bool = False):
+        """Stop the cat-file worker (caller holds _cat_file_lock)"""
+        proc = self._cat_file_proc
+        if proc is None:
+            return
+        self._cat_file_proc = None
+
+        if not kill:
+            try:
+                # EOF on stdin lets the worker exit on its own
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                kill = True
+        if kill:
+            proc.kill()
+            proc.wait()
+
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def close(self):
+        """Stop the cat-file worker"""
+        with self._cat_file_lock:
+            self._stop_cat_file()
+        with _cat_file_volumes_lock:
+            _cat_file_volumes.pop(self, None)
 
     def create_branch(self, branch_name: str) -> bool:
         """Create a new Git branch"""
@@ -350,6 +576,11 @@ class VolumeManager:
             )
         return self._volumes[key]
 
+    def close(self):
+        """Stop the Git workers of all open volumes"""
+        for volume in self._volumes.values():
+            volume.close()
+
     def list_teams(self) -> List[str]:
         """List all team IDs"""
         teams_path = self.base_path / "teams"
@@ -0,0 +1,103 @@
+"""
+Shared Pydantic models for the Vercel functions (chat, sessions, skills)
+
+Defined once so every function imports the same classes instead of
+redeclaring them. The leading underscore keeps Vercel from deploying this
+module as a function of its own.
+"""
+from pydantic import BaseModel
+from typing import List, Optional, Dict, Any, Type
+
+
+# ============================================================================
+# Chat
+# ============================================================================
+
+class ChatRequest(BaseModel):
+    user_id: str
+    team_id: str
+    message: str
+    session_id: Optional[str] = None
+    include_skills: bool = True
+    max_skills: int = 5
+    model: Optional[str] = "anthropic/claude-opus-4.5"
+
+
+class ChatResponse(BaseModel):
+    response: str
+    skills_used: List[str]
+    trace_id: str
+    session_id: str
+
+
+# ============================================================================
+# Sessions
+# ============================================================================
+
+class Message(BaseModel):
+    role: str
+    content: str
+    timestamp: str
+    traces: Optional[List[int]] = None
+    artifacts: Optional[List[str]] = None
+
+
+class Session(BaseModel):
+    id: str
+    name: str
+    volume: str  # 'system', 'team', or 'user'
+    status: str  # 'active', 'paused', 'completed'
+    messages: List[Message]
+    traces_count: int
+    created_at: str
+    updated_at: str
+    metadata: Dict[str, Any] = {}
+
+
+class SessionCreateRequest(BaseModel):
+    name: str
+    volume: str
+    initial_message: Optional[str] = None
+
+
+# ============================================================================
+# Skills
+# ============================================================================
+
+class Skill(BaseModel):
+    id: str
+    name: str
+    description: str
+    code: str
+    language: str
+    tags: List[str]
+    usage_count: int
+    success_rate: float
+    created_at: str
+    updated_at: str
+
+
+class SkillCreateRequest(BaseModel):
+    name: str
+    description: str
+    code: str
+    language: str
+    tags: List[str] = []
+
+
+# ============================================================================
+# Warm-up
+# ============================================================================
+
+def warm_up_models(fixtures: Dict[Type[BaseModel], Dict[str, Any]]):
+    """
+    Run one validation and one JSON dump per model.
+
+    Pays Pydantic's first-use cost at startup instead of on the first
+    request that touches each model.
+
+    Args:
+        fixtures: Minimal valid input for each model
+    """
+    for model, data in fixtures.items():
+        model.model_validate(data).model_dump_json()
@@ -0,0 +1,172 @@
+"""
+Session management endpoints (served through api/index.py)
+"""
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict
+import orjson
+
+from api._clock import utc_now_iso
+from api._models import Message, SessionCreateRequest
+
+router = APIRouter(prefix="/api/sessions", tags=["sessions"])
+
+
+# Mock data until sessions are loaded from Vercel KV storage.
+# Serialized once at import so the read endpoints only hand out bytes.
+MOCK_SESSIONS = [
+    {
+        "id": "sess_quantum_research",
+        "name": "Quantum Research",
+        "volume": "user",
+        "status": "active",
+        "messages": [
+            {
+                "role": "user",
+                "content": "Create a quantum circuit with 3 qubits",
+                "timestamp": "2025-12-13T10:00:00Z",
+                "traces": None,
+                "artifacts": None
+            },
+            {
+                "role": "assistant",
+                "content": "I'll create a quantum circuit with 3 qubits using Qiskit.",
+                "timestamp": "2025-12-13T10:00:05Z",
+                "traces": [1, 2, 3],
+                "artifacts": ["quantum_circuit.py", "circuit_diagram.png"]
+            }
+        ],
+        "traces_count": 3,
+        "created_at": "2025-12-13T10:00:00Z",
+        "updated_at": "2025-12-13T10:30:00Z",
+        "metadata": {"project": "qiskit-studio"}
+    },
+    {
+        "id": "sess_data_analysis",
+        "name": "Data Analysis Pipeline",
+        "volume": "team",
+        "status": "paused",
+        "messages": [
+            {
+                "role": "user",
+                "content": "Analyze sales data from Q4",
+                "timestamp": "2025-12-12T14:00:00Z",
+                "traces": None,
+                "artifacts": None
+            }
+        ],
+        "traces_count": 5,
+        "created_at": "2025-12-12T14:00:00Z",
+        "updated_at": "2025-12-12T16:00:00Z",
+        "metadata": {"team": "analytics"}
+    }
+]
+
+SESSIONS_BY_VOLUME: Dict[Optional[str], bytes] = {
+    volume: orjson.dumps({
+        "sessions": [s for s in MOCK_SESSIONS if volume is None or s["volume"] == volume]
+    })
+    for volume in (None, "system", "team", "user")
+}
+EMPTY_SESSIONS = orjson.dumps({"sessions": []})
+
+SESSION_BY_ID: Dict[str, bytes] = {
+    "sess_quantum_research": orjson.dumps(MOCK_SESSIONS[0])
+}
+
+
+@router.get("")
+async def list_sessions(volume: Optional[str] = None):
+    """
+    List all sessions, optionally filtered by volume
+
+    TODO: Load from Vercel KV storage
+    For now, return mock data
+    """
+    body = SESSIONS_BY_VOLUME.get(volume, EMPTY_SESSIONS)
+    return Response(body, media_type="application/json")
+
+
+@router.get("/{session_id}")
+async def get_session(session_id: str):
+    """
+    Get a specific session by ID
+
+    TODO: Load from Vercel KV storage
+    """
+    body = SESSION_BY_ID.get(session_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return Response(body, media_type="application/json")
+
+
+@router.post("")
+async def create_session(session_req: SessionCreateRequest):
+    """
+    Create a new session
+
+    TODO: Save to Vercel KV storage
+    """
+    session_id = f"sess_{session_req.name.lower().replace(' ', '_')}"
+    now = utc_now_iso()
+
+    messages = []
+    if session_req.initial_message:
+        messages.append({
+            "role": "user",
+            "content": session_req.initial_message,
+            "timestamp": now,
+            "traces": None,
+            "artifacts": None
+        })
+
+    return ORJSONResponse({
+        "id": session_id,
+        "name": session_req.name,
+        "volume": session_req.volume,
+        "status": "active",
+        "messages": messages,
+        "traces_count": 0,
+        "created_at": now,
+        "updated_at": now,
+        "metadata": {}
+    }, status_code=201)
+
+
+@router.post("/{session_id}/messages")
+async def add_message(session_id: str, message: Message):
+    """
+    Add a message to a session
+
+    TODO: Update in Vercel KV storage
+    """
+    return ORJSONResponse({
+        "message": "Message added to session",
+        "session_id": session_id
+    })
+
+
+@router.put("/{session_id}")
+async def update_session(session_id: str, status: Optional[str] = None):
+    """
+    Update session status or metadata
+
+    TODO: Update in Vercel KV storage
+    """
+    return ORJSONResponse({
+        "id": session_id,
+        "status": status or "active",
+        "updated_at": utc_now_iso()
+    })
+
+
+@router.delete("/{session_id}")
+async def delete_session(session_id: str):
+    """
+    Delete a session
+
+    TODO: Delete from Vercel KV storage
+    """
+    return ORJSONResponse({"message": f"Session {session_id} deleted"})
+
@@ -0,0 +1,155 @@
+"""
+Skills management endpoints (served through api/index.py)
+"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict
+import hashlib
+import json
+import orjson
+
+from api._http import make_etag, json_response_with_etag
+from api._models import SkillCreateRequest
+
+router = APIRouter(prefix="/api/skills", tags=["skills"])
+
+
+# Mock data until skills are loaded from Vercel Blob storage.
+# Serialized once at import so the read endpoints only hand out bytes.
+MOCK_SKILLS = [
+    {
+        "id": "skill_001",
+        "name": "quantum_circuit_builder",
+        "description": "Builds quantum circuits with error correction",
+        "code": "def build_circuit(qubits: int) -> str:\n    ...",
+        "language": "python",
+        "tags": ["quantum", "qiskit"],
+        "usage_count": 42,
+        "success_rate": 0.96,
+        "created_at": "2025-12-01T10:00:00Z",
+        "updated_at": "2025-12-10T15:30:00Z"
+    },
+    {
+        "id": "skill_002",
+        "name": "data_analyzer",
+        "description": "Analyzes CSV data and generates insights",
+        "code": "def analyze_data(csv_path: str) -> dict:\n    ...",
+        "language": "python",
+        "tags": ["data", "analysis"],
+        "usage_count": 28,
+        "success_rate": 0.89,
+        "created_at": "2025-12-05T12:00:00Z",
+        "updated_at": "2025-12-08T09:15:00Z"
+    }
+]
+
+MOCK_SKILL_DETAILS = {
+    "skill_001": {
+        **MOCK_SKILLS[0],
+        "code": """def build_circuit(qubits: int) -> str:
+    from qiskit import QuantumCircuit
+
+    qc = QuantumCircuit(qubits)
+    for i in range(qubits):
+        qc.h(i)
+    qc.measure_all()
+
+    return qc.qasm()
+""",
+    }
+}
+
+SKILLS_BODY = orjson.dumps({"skills": MOCK_SKILLS})
+SKILL_BODY_BY_ID: Dict[str, bytes] = {
+    skill_id: orjson.dumps(skill) for skill_id, skill in MOCK_SKILL_DETAILS.items()
+}
+
+# The bodies never change, so neither do their ETags
+SKILLS_ETAG = make_etag(SKILLS_BODY)
+SKILL_ETAG_BY_ID: Dict[str, str] = {
+    skill_id: make_etag(body) for skill_id, body in SKILL_BODY_BY_ID.items()
+}
+
+
+@router.get("")
+async def list_skills(request: Request):
+    """
+    List all available skills
+
+    TODO: Load from Vercel Blob storage
+    For now, return mock data
+    """
+    return json_response_with_etag(request, SKILLS_BODY, SKILLS_ETAG)
+
+
+@router.get("/{skill_id}")
+async def get_skill(skill_id: str, request: Request):
+    """
+    Get a specific skill by ID
+
+    TODO: Load from Vercel Blob storage
+    """
+    body = SKILL_BODY_BY_ID.get(skill_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+
+    return json_response_with_etag(request, body, SKILL_ETAG_BY_ID[skill_id])
+
+
+@router.post("")
+async def create_skill(skill_req: SkillCreateRequest):
+    """
+    Create a new skill
+
+    TODO: Save to Vercel Blob storage
+    """
+    # Mock response
+    # blake2b instead of hash(): the same name maps to the same ID in every
+    # function instance (str hashes are randomized per process)
+    digest = hashlib.blake2b(skill_req.name.encode(), digest_size=2).digest()
+    skill_id = f"skill_{int.from_bytes(digest, 'big') % 1000:03d}"
+
+    return ORJSONResponse({
+        "id": skill_id,
+        "name": skill_req.name,
+        "description": skill_req.description,
+        "code": skill_req.code,
+        "language": skill_req.language,
+        "tags": skill_req.tags,
+        "usage_count": 0,
+        "success_rate": 0.0,
+        "created_at": "2025-12-13T00:00:00Z",
+        "updated_at": "2025-12-13T00:00:00Z"
+    }, status_code=201)
+
+
+@router.put("/{skill_id}")
+async def update_skill(skill_id: str, skill_req: SkillCreateRequest):
+    """
+    Update an existing skill
+
+    TODO: Update in Vercel Blob storage
+    """
+    return ORJSONResponse({
+        "id": skill_id,
+        "name": skill_req.name,
+        "description": skill_req.description,
+        "code": skill_req.code,
+        "language": skill_req.language,
+        "tags": skill_req.tags,
+        "usage_count": 42,  # Preserve existing count
+        "success_rate": 0.96,
+        "created_at": "2025-12-01T10:00:00Z",
+        "updated_at": "2025-12-13T00:00:00Z"
+    })
+
+
+@router.delete("/{skill_id}")
+async def delete_skill(skill_id: str):
+    """
+    Delete a skill
+
+    TODO: Delete from Vercel Blob storage
+    """
+    return ORJSONResponse({"message": f"Skill {skill_id} deleted"})
+
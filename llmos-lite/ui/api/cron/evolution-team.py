@@ -1,140 +0,0 @@
-"""
-Vercel Cron Function: Team Evolution (Weekly)
-
-Runs weekly on Sunday at midnight UTC to analyze team traces and evolve shared skills.
-
-Schedule: 0 0 * * 0 (weekly on Sunday)
-"""
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-from datetime import datetime
-import json
-
-app = FastAPI()
-
-
-@app.get("/")
-async def team_evolution_cron():
-    """
-    Weekly team evolution cron job.
-
-    For each team:
-    1. Load execution traces from all team members (past 7 days)
-    2. Detect cross-user patterns (2+ users, 3+ traces)
-    3. Generate shared team skills
-    4. Identify collaboration patterns
-    5. Create Git commit in team volume with evolution summary
-
-    TODO: Integrate with Vercel Blob (team traces) and KV (team sessions)
-    """
-    start_time = datetime.utcnow()
-
-    # Mock evolution results
-    evolution_results = {
-        "timestamp": start_time.isoformat() + "Z",
-        "teams_processed": 2,
-        "teams": [
-            {
-                "team_id": "team_quantum",
-                "team_name": "Quantum Research Team",
-                "members": 4,
-                "traces_analyzed": 52,
-                "patterns_detected": 3,
-                "skills_created": 2,
-                "skills_updated": 1,
-                "patterns": [
-                    {
-                        "pattern_id": "team_pattern_001",
-                        "description": "Collaborative quantum circuit optimization",
-                        "users": ["user_alice", "user_bob", "user_charlie"],
-                        "occurrences": 12,
-                        "success_rate": 0.94,
-                        "action": "Created team skill: quantum_optimizer"
-                    },
-                    {
-                        "pattern_id": "team_pattern_002",
-                        "description": "Result validation workflow",
-                        "users": ["user_alice", "user_david"],
-                        "occurrences": 8,
-                        "success_rate": 0.89,
-                        "action": "Created team skill: result_validator"
-                    },
-                    {
-                        "pattern_id": "team_pattern_003",
-                        "description": "Data export to common format",
-                        "users": ["user_bob", "user_charlie", "user_david"],
-                        "occurrences": 6,
-                        "success_rate": 0.91,
-                        "action": "Updated team skill: data_exporter (v1.3)"
-                    }
-                ],
-                "collaboration_insights": {
-                    "most_active_pair": ["user_alice", "user_bob"],
-                    "shared_workflows": 5,
-                    "knowledge_transfer_count": 3
-                }
-            },
-            {
-                "team_id": "team_analytics",
-                "team_name": "Data Analytics Team",
-                "members": 3,
-                "traces_analyzed": 28,
-                "patterns_detected": 1,
-                "skills_created": 0,
-                "skills_updated": 1,
-                "patterns": [
-                    {
-                        "pattern_id": "team_pattern_004",
-                        "description": "Dashboard generation",
-                        "users": ["user_eve", "user_frank"],
-                        "occurrences": 7,
-                        "success_rate": 0.88,
-                        "action": "Updated team skill: dashboard_gen (v2.0)"
-                    }
-                ],
-                "collaboration_insights": {
-                    "most_active_pair": ["user_eve", "user_frank"],
-                    "shared_workflows": 3,
-                    "knowledge_transfer_count": 2
-                }
-            }
-        ],
-        "total_patterns": 4,
-        "total_skills_created": 2,
-        "total_skills_updated": 2,
-        "execution_time_ms": 2100
-    }
-
-    # TODO: For each team with patterns:
-    # 1. Create Git commit in team volume with evolution summary
-    # 2. Commit message format:
-    #    [TEAM-EVOLUTION] Weekly team evolution - {date}
-    #
-    #    Team: {team_name}
-    #    Members active: {count}
-    #    Patterns detected: {count}
-    #    Skills created: {count}
-    #    Skills updated: {count}
-    #
-    #    ## Pattern: {pattern_description}
-    #    - Collaborators: {users}
-    #    - Occurrences: {count}
-    #    - Success rate: {rate}
-    #    - Action: {action}
-    #
-    #    ## Collaboration Insights
-    #    - Most active pair: {pair}
-    #    - Shared workflows: {count}
-    #    - Knowledge transfers: {count}
-
-    return JSONResponse({
-        "status": "completed",
-        "type": "team_evolution",
-        "schedule": "weekly",
-        "results": evolution_results,
-        "next_run": "2025-12-21T00:00:00Z"
-    })
-
-
-# Vercel expects the FastAPI app to be exported
-handler = app
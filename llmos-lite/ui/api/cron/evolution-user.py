@@ -1,115 +0,0 @@
-"""
-Vercel Cron Function: User Evolution (Daily)
-
-Runs daily at midnight UTC to analyze user traces and evolve skills.
-
-Schedule: 0 0 * * * (daily at midnight)
-"""
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-from datetime import datetime
-import json
-
-app = FastAPI()
-
-
-@app.get("/")
-async def user_evolution_cron():
-    """
-    Daily user evolution cron job.
-
-    For each active user:
-    1. Load execution traces from past 24 hours
-    2. Detect patterns (3+ similar traces)
-    3. Generate new skills from patterns
-    4. Update skill success rates
-    5. Create Git commit with evolution summary
-
-    TODO: Integrate with Vercel Blob (traces) and KV (user sessions)
-    """
-    start_time = datetime.utcnow()
-
-    # Mock evolution results
-    evolution_results = {
-        "timestamp": start_time.isoformat() + "Z",
-        "users_processed": 3,
-        "users": [
-            {
-                "user_id": "user_alice",
-                "traces_analyzed": 15,
-                "patterns_detected": 2,
-                "skills_created": 1,
-                "skills_updated": 3,
-                "patterns": [
-                    {
-                        "pattern_id": "pattern_001",
-                        "description": "Quantum circuit creation with 3-5 qubits",
-                        "occurrences": 5,
-                        "success_rate": 0.95,
-                        "action": "Created skill: quantum_circuit_builder"
-                    },
-                    {
-                        "pattern_id": "pattern_002",
-                        "description": "Data analysis on CSV files",
-                        "occurrences": 3,
-                        "success_rate": 0.87,
-                        "action": "Updated skill: data_analyzer (v1.2)"
-                    }
-                ]
-            },
-            {
-                "user_id": "user_bob",
-                "traces_analyzed": 8,
-                "patterns_detected": 1,
-                "skills_created": 0,
-                "skills_updated": 1,
-                "patterns": [
-                    {
-                        "pattern_id": "pattern_003",
-                        "description": "3D model rendering",
-                        "occurrences": 4,
-                        "success_rate": 0.92,
-                        "action": "Updated skill: model_renderer (v2.1)"
-                    }
-                ]
-            },
-            {
-                "user_id": "user_charlie",
-                "traces_analyzed": 3,
-                "patterns_detected": 0,
-                "skills_created": 0,
-                "skills_updated": 0,
-                "patterns": []
-            }
-        ],
-        "total_patterns": 3,
-        "total_skills_created": 1,
-        "total_skills_updated": 4,
-        "execution_time_ms": 1250
-    }
-
-    # TODO: For each user with patterns:
-    # 1. Create Git commit with evolution summary
-    # 2. Commit message format:
-    #    [EVOLUTION] Daily user evolution - {date}
-    #
-    #    Patterns detected: {count}
-    #    Skills created: {count}
-    #    Skills updated: {count}
-    #
-    #    ## Pattern: {pattern_description}
-    #    - Occurrences: {count}
-    #    - Success rate: {rate}
-    #    - Action: {action}
-
-    return JSONResponse({
-        "status": "completed",
-        "type": "user_evolution",
-        "schedule": "daily",
-        "results": evolution_results,
-        "next_run": "2025-12-14T00:00:00Z"
-    })
-
-
-# Vercel expects the FastAPI app to be exported
-handler = app
@@ -0,0 +1,37 @@
+"""
+Vercel Function: single entrypoint for the serverless API
+
+vercel.json rewrites every /api/* request here, so chat, sessions, skills
+and the evolution crons share one FastAPI app (one OpenAPI schema, one
+set of validators) instead of each building its own on cold start.
+"""
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from api._routes.chat import router as chat_router
+from api._routes.sessions import router as sessions_router
+from api._routes.skills import router as skills_router
+from api._routes.cron.evolution_user import router as evolution_user_router
+from api._routes.cron.evolution_team import router as evolution_team_router
+from api._models import ChatRequest, Message, SessionCreateRequest, SkillCreateRequest, warm_up_models
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+app.include_router(chat_router)
+app.include_router(sessions_router)
+app.include_router(skills_router)
+app.include_router(evolution_user_router)
+app.include_router(evolution_team_router)
+
+# Pay Pydantic's first-use cost for the request models during the cold
+# start itself; Vercel does not reliably run a lifespan
+warm_up_models({
+    ChatRequest: {"user_id": "", "team_id": "", "message": ""},
+    Message: {"role": "", "content": "", "timestamp": ""},
+    SessionCreateRequest: {"name": "", "volume": ""},
+    SkillCreateRequest: {"name": "", "description": "", "code": "", "language": ""}
+})
+
+
+# Vercel expects the FastAPI app to be exported
+handler = app
@@ -20,11 +20,14 @@ Node Types:
 - ThreeJSNode: Renders 3D scenes
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
+import asyncio
 import json
 import re
+import orjson
 
 
 class NodeType(Enum):
@@ -52,6 +55,15 @@ class NodeInput:
     default: Any = None
     required: bool = True
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "default": self.default,
+            "required": self.required
+        }
+
 
 @dataclass
 class NodeOutput:
@@ -60,6 +72,13 @@ class NodeOutput:
     type: str
     description: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description
+        }
+
 
 @dataclass
 class ExecutableSkill:
@@ -91,6 +110,10 @@ class ExecutableSkill:
     estimated_time_ms: int = 100
     memory_mb: int = 10
 
+    # Encoded JSON, filled on first use (skills are not mutated once parsed)
+    _catalog_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _browser_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
     def to_markdown(self) -> str:
         """
         Convert to Markdown format for storage.
@@ -200,24 +223,8 @@ Memory usage: ~{self.memory_mb}MB
             "name": self.name,
             "type": self.node_type.value,
             "executionMode": self.execution_mode.value,
-            "inputs": [
-                {
-                    "name": inp.name,
-                    "type": inp.type,
-                    "description": inp.description,
-                    "default": inp.default,
-                    "required": inp.required
-                }
-                for inp in self.inputs
-            ],
-            "outputs": [
-                {
-                    "name": out.name,
-                    "type": out.type,
-                    "description": out.description
-                }
-                for out in self.outputs
-            ],
+            "inputs": [inp.to_dict() for inp in self.inputs],
+            "outputs": [out.to_dict() for out in self.outputs],
             "code": self.code,
             "metadata": {
                 "category": self.category,
@@ -228,6 +235,38 @@ Memory usage: ~{self.memory_mb}MB
             }
         }
 
+    def browser_payload_json(self) -> bytes:
+        """to_browser_payload() encoded as JSON, computed once per skill"""
+        if self._browser_json is None:
+            self._browser_json = orjson.dumps(self.to_browser_payload())
+        return self._browser_json
+
+    def to_catalog_entry(self) -> Dict[str, Any]:
+        """
+        Convert to the skill catalog entry listed by the workflows API.
+
+        Same fields as the API's ExecutableSkillResponse, without the code.
+        """
+        return {
+            "skill_id": self.skill_id,
+            "name": self.name,
+            "description": self.description,
+            "node_type": self.node_type.value,
+            "execution_mode": self.execution_mode.value,
+            "category": self.category,
+            "tags": self.tags,
+            "inputs": [inp.to_dict() for inp in self.inputs],
+            "outputs": [out.to_dict() for out in self.outputs],
+            "estimated_time_ms": self.estimated_time_ms,
+            "memory_mb": self.memory_mb
+        }
+
+    def catalog_entry_json(self) -> bytes:
+        """to_catalog_entry() encoded as JSON, computed once per skill"""
+        if self._catalog_json is None:
+            self._catalog_json = orjson.dumps(self.to_catalog_entry())
+        return self._catalog_json
+
 
 @dataclass
 class WorkflowNode:
@@ -488,6 +527,10 @@ class ExecutableSkillParser:
             return None
 
 
+# Skill files parsed at once by load_executable_skills_async (caps open FDs)
+PARSE_CONCURRENCY = 32
+
+
 class WorkflowEngine:
     """
     Manages workflow execution and skill library.
@@ -501,7 +544,11 @@ class WorkflowEngine:
 
     def __init__(self, volume_manager):
         self.volume_manager = volume_manager
-        self._skills_cache: Dict[str, ExecutableSkill] = {}
+        # Last loaded skill for each ID, across all volumes
+        self._skills_by_id: Dict[str, ExecutableSkill] = {}
+        # Skill file -> ((mtime_ns, size), parsed skill); an unchanged file
+        # is neither read nor parsed again, and keeps its encoded JSON
+        self._parsed: Dict[Path, Tuple[Tuple[int, int], ExecutableSkill]] = {}
 
     def load_executable_skills(
         self,
@@ -529,24 +576,81 @@ class WorkflowEngine:
 
         return skills
 
+    async def load_executable_skills_async(
+        self,
+        user_id: str,
+        team_id: str
+    ) -> List[ExecutableSkill]:
+        """
+        Same as load_executable_skills(), without blocking the event loop.
+
+        Skill files are read and parsed in worker threads, at most
+        PARSE_CONCURRENCY at a time.
+        """
+        volumes = [
+            self.volume_manager.get_system_volume(readonly=True),
+            self.volume_manager.get_team_volume(team_id, readonly=True),
+            self.volume_manager.get_user_volume(user_id, readonly=False)
+        ]
+        paths = [path for volume in volumes for path in self._skill_paths(volume)]
+
+        semaphore = asyncio.Semaphore(PARSE_CONCURRENCY)
+
+        async def parse(path: Path) -> Optional[ExecutableSkill]:
+            async with semaphore:
+                return await asyncio.to_thread(self._parse_skill_file, path)
+
+        # gather keeps the order: system, team, then user skills
+        skills = [
+            skill for skill in await asyncio.gather(*(parse(p) for p in paths))
+            if skill
+        ]
+        for skill in skills:
+            self._skills_by_id[skill.skill_id] = skill
+
+        return skills
+
     def _load_skills_from_volume(self, volume) -> List[ExecutableSkill]:
         """Load executable skills from a volume"""
         skills = []
-        skill_ids = volume.list_skills()
 
-        for skill_id in skill_ids:
-            content = volume.read_skill(skill_id)
-            if content:
-                skill = ExecutableSkillParser.parse(content)
-                if skill:
-                    skills.append(skill)
-                    self._skills_cache[skill.skill_id] = skill
+        for path in self._skill_paths(volume):
+            skill = self._parse_skill_file(path)
+            if skill:
+                skills.append(skill)
+                self._skills_by_id[skill.skill_id] = skill
 
         return skills
 
+    @staticmethod
+    def _skill_paths(volume) -> List[Path]:
+        """Skill files of a volume"""
+        return [volume.skills_path / f"{skill_id}.md" for skill_id in volume.list_skills()]
+
+    def _parse_skill_file(self, path: Path) -> Optional[ExecutableSkill]:
+        """Parse a skill file, reusing the last result if the file is unchanged"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._parsed.pop(path, None)
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        content = path.read_text()
+        skill = ExecutableSkillParser.parse(content) if content else None
+        if skill:
+            self._parsed[path] = (key, skill)
+        else:
+            self._parsed.pop(path, None)
+        return skill
+
     def get_skill(self, skill_id: str) -> Optional[ExecutableSkill]:
         """Get a cached executable skill by ID"""
-        return self._skills_cache.get(skill_id)
+        return self._skills_by_id.get(skill_id)
 
     def save_workflow(
         self,
@@ -586,3 +690,39 @@ class WorkflowEngine:
             "workflow": workflow.to_dict(),
             "skills": skills_payload
         }
+
+    def prepare_for_browser_json(
+        self,
+        workflow: Workflow,
+        skills_by_id: Optional[Dict[str, ExecutableSkill]] = None
+    ) -> bytes:
+        """
+        prepare_for_browser() encoded as JSON.
+
+        Each skill's payload (code included) is spliced in from its cached
+        encoding, so a popular skill's code is not escaped again for
+        every workflow that uses it.
+
+        Args:
+            workflow: Workflow to prepare
+            skills_by_id: Skills visible to the workflow's user; defaults
+                to the last skills loaded by this engine (any user)
+        """
+        if skills_by_id is None:
+            skills_by_id = self._skills_by_id
+
+        skills_json: Dict[str, bytes] = {}
+        for node in workflow.nodes:
+            skill = skills_by_id.get(node.skill_id)
+            if skill:
+                skills_json[skill.skill_id] = skill.browser_payload_json()
+
+        skills_body = b",".join(
+            orjson.dumps(skill_id) + b":" + payload
+            for skill_id, payload in skills_json.items()
+        )
+
+        return (
+            b'{"workflow":' + orjson.dumps(workflow.to_dict()) +
+            b',"skills":{' + skills_body + b"}}"
+        )
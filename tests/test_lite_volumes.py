@@ -0,0 +1,225 @@
+"""
+Tests for LLMos-Lite Git volumes (llmos-lite/core/volumes.py)
+
+Covers the traces index behind /traces and the `git cat-file --batch`
+workers behind get_git_log().
+"""
+
+import pytest
+from pathlib import Path
+import subprocess
+import sys
+
+# Add llmos-lite to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "llmos-lite"))
+
+from core import volumes
+from core.volumes import GitVolume, VolumeManager
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    """Let volumes commit without a global Git identity"""
+    for var in ["GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"]:
+        monkeypatch.setenv(var, "test")
+    for var in ["GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"]:
+        monkeypatch.setenv(var, "test@llmos")
+
+
+@pytest.fixture
+def volume_manager(tmp_path):
+    """Volume manager over a temporary volumes root"""
+    manager = VolumeManager(tmp_path / "volumes")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def user_volume(volume_manager):
+    return volume_manager.get_user_volume("alice")
+
+
+def write_traces(volume, *trace_ids):
+    for trace_id in trace_ids:
+        volume.write_trace(trace_id, f"# Execution Trace: {trace_id} title\n\nbody\n")
+
+
+def git(volume, *args):
+    return subprocess.run(
+        ["git", *args], cwd=volume.base_path, capture_output=True, text=True, check=True
+    ).stdout
+
+
+# =============================================================================
+# Traces index
+# =============================================================================
+
+class TestTracesIndex:
+
+    def test_summaries_newest_first(self, user_volume):
+        write_traces(user_volume, "t1", "t2", "t3")
+
+        summaries = user_volume.list_trace_summaries()
+
+        assert [s["trace_id"] for s in summaries] == ["t3", "t2", "t1"]
+        assert summaries[0]["title"] == "t3 title"
+
+    def test_limit(self, user_volume):
+        write_traces(user_volume, "t1", "t2", "t3")
+
+        assert [s["trace_id"] for s in user_volume.list_trace_summaries(limit=2)] == ["t3", "t2"]
+
+    def test_rewritten_trace_listed_once(self, user_volume):
+        write_traces(user_volume, "t1", "t2", "t1")
+
+        assert [s["trace_id"] for s in user_volume.list_trace_summaries()] == ["t1", "t2"]
+
+    def test_missing_index_is_rebuilt(self, user_volume):
+        write_traces(user_volume, "t1", "t2")
+        user_volume.traces_index_path.unlink()
+
+        assert {s["trace_id"] for s in user_volume.list_trace_summaries()} == {"t1", "t2"}
+        assert user_volume.traces_index_path.exists()
+
+    def test_deleted_trace_dropped(self, user_volume):
+        write_traces(user_volume, "t1", "t2")
+
+        user_volume.delete_trace("t1")
+
+        assert [s["trace_id"] for s in user_volume.list_trace_summaries()] == ["t2"]
+
+    def test_torn_line_triggers_rebuild(self, user_volume):
+        write_traces(user_volume, "t1", "t2")
+        with open(user_volume.traces_index_path, "ab") as f:
+            f.write(b'{"trace_id": "t3", "ti')
+        # Appended onto the torn line
+        write_traces(user_volume, "t4")
+
+        summaries = user_volume.list_trace_summaries()
+
+        assert {s["trace_id"] for s in summaries} == {"t1", "t2", "t4"}
+        # The rebuilt index parses cleanly on the next call
+        assert user_volume.list_trace_summaries() == summaries
+        assert not user_volume.traces_index_path.with_name("traces_index.jsonl.tmp").exists()
+
+    def test_index_not_committed(self, user_volume):
+        write_traces(user_volume, "t1")
+        user_volume.list_trace_summaries()
+
+        user_volume.write_skill("s1", "content", commit_message="Create skill: S1")
+
+        tracked = git(user_volume, "ls-files").split()
+        assert "traces/t1.md" in tracked
+        assert "traces_index.jsonl" not in tracked
+
+
+# =============================================================================
+# Git log through cat-file workers
+# =============================================================================
+
+def git_log(volume, limit):
+    """Reference log from `git log` itself, in get_git_log()'s shape"""
+    out = git(volume, "log", f"-{limit}", "--first-parent", "--pretty=%H|%an|%at|%s")
+    commits = []
+    for line in out.splitlines():
+        hash_val, author, timestamp, message = line.split("|", 3)
+        commits.append({
+            "hash": hash_val,
+            "author": author,
+            "timestamp": int(timestamp),
+            "message": message
+        })
+    return commits
+
+
+def live_workers(vols):
+    return [v for v in vols if v._cat_file_proc is not None]
+
+
+class TestGitLog:
+
+    def test_matches_git_log(self, user_volume):
+        messages = [
+            "Create skill: S0",
+            "Subject only",
+            "Subject\n\nBody paragraph\nover two lines",
+            "Wrapped\nsubject line\n\nBody",
+            "Unicode: caf\u00e9 \u2713",
+            "Pipes | in | subject",
+        ]
+        for i in range(15):
+            user_volume.write_skill(f"s{i}", f"content {i}", commit_message=messages[i % len(messages)])
+
+        for limit in (1, 10, 50):
+            assert user_volume.get_git_log(limit=limit) == git_log(user_volume, limit)
+
+    def test_missing_head(self, tmp_path):
+        volume = GitVolume(volumes.VolumeType.USER, tmp_path / "empty", "nobody")
+        subprocess.run(["git", "update-ref", "-d", "HEAD"], cwd=volume.base_path, check=True)
+
+        assert volume.get_git_log() == []
+        volume.close()
+
+    def test_killed_worker_restarted(self, user_volume):
+        expected = user_volume.get_git_log()
+        proc = user_volume._cat_file_proc
+        proc.kill()
+        proc.wait()
+
+        assert user_volume.get_git_log() == expected
+        assert user_volume._cat_file_proc is not proc
+        assert user_volume._cat_file_proc.poll() is None
+
+    def test_partial_read_drops_worker(self, user_volume):
+        expected = user_volume.get_git_log()
+        proc = user_volume._cat_file_proc
+
+        class TruncatedStdout:
+            """Claims a bigger object than the worker sends"""
+            def readline(self):
+                proc_stdout.readline()
+                return b"0000 commit 999999\n"
+
+            def read(self, n):
+                return b"x"
+
+            def close(self):
+                proc_stdout.close()
+
+        proc_stdout = proc.stdout
+        proc.stdout = TruncatedStdout()
+
+        assert user_volume.get_git_log() == []
+        assert user_volume._cat_file_proc is None
+        assert proc.poll() is not None
+        # Next call starts a clean worker
+        assert user_volume.get_git_log() == expected
+
+    def test_workers_capped(self, volume_manager, monkeypatch):
+        monkeypatch.setattr(GitVolume, "MAX_CAT_FILE_WORKERS", 2)
+        vols = [volume_manager.get_user_volume(f"u{i}") for i in range(4)]
+
+        for volume in vols:
+            assert len(volume.get_git_log()) == 1
+
+        # Least recently used workers were stopped
+        assert live_workers(vols) == vols[2:]
+        assert len(volumes._cat_file_volumes) == 2
+
+        # A stopped volume restarts its worker on next use
+        assert len(vols[0].get_git_log()) == 1
+        assert live_workers(vols) == [vols[0], vols[3]]
+
+    def test_close_stops_workers(self, volume_manager):
+        vols = [volume_manager.get_user_volume(f"u{i}") for i in range(3)]
+        for volume in vols:
+            volume.get_git_log()
+
+        volume_manager.close()
+
+        assert live_workers(vols) == []
+        assert not any(v in volumes._cat_file_volumes for v in vols)
@@ -0,0 +1,183 @@
+"""
+Tests for the LLMos-Lite workflow endpoints (llmos-lite/api/workflows.py)
+
+Covers request validation of /workflows/execute and /workflows/save, and
+which skills /workflows/execute hands to the browser.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add llmos-lite to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "llmos-lite"))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.volumes import VolumeManager
+from core.workflow import WorkflowEngine
+from api import workflows
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    """Let volumes commit without a global Git identity"""
+    for var in ["GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"]:
+        monkeypatch.setenv(var, "test")
+    for var in ["GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"]:
+        monkeypatch.setenv(var, "test@llmos")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Workflow router over a temporary volumes root"""
+    volume_manager = VolumeManager(tmp_path / "volumes")
+    monkeypatch.setattr(workflows, "workflow_engine", WorkflowEngine(volume_manager))
+    monkeypatch.setattr(workflows, "_skills_cache", {})
+    monkeypatch.setattr(workflows, "_pending_saves", {})
+    monkeypatch.setattr(workflows, "SAVE_DEBOUNCE_SECONDS", 0)
+
+    app = FastAPI()
+    app.include_router(workflows.router)
+    with TestClient(app) as c:
+        c.volume_manager = volume_manager
+        yield c
+    volume_manager.close()
+
+
+NODE = {"nodeId": "n1", "skillId": "missing-skill", "position": {"x": 0, "y": 0}}
+EDGE = {"edgeId": "e1", "source": "n1", "sourceOutput": "o", "target": "n1", "targetInput": "i"}
+
+EXECUTE = {"user_id": "alice", "team_id": "eng", "workflow_id": "w1", "nodes": [NODE], "edges": [EDGE]}
+SAVE = {"user_id": "alice", "workflow_id": "w1", "name": "W", "description": "D", "nodes": [NODE], "edges": [EDGE]}
+
+
+def error_locs(response):
+    assert response.status_code == 422, response.text
+    return [tuple(err["loc"]) for err in response.json()["detail"]]
+
+
+# =============================================================================
+# Request validation
+# =============================================================================
+
+class TestRequestValidation:
+
+    def test_valid_execute(self, client):
+        r = client.post("/workflows/execute", json=EXECUTE)
+
+        assert r.status_code == 200
+        assert r.json()["payload"]["workflow"]["nodes"][0]["nodeId"] == "n1"
+
+    def test_valid_save(self, client):
+        r = client.post("/workflows/save", json=SAVE)
+
+        assert r.status_code == 202
+        assert r.json() == {"status": "queued", "workflow_id": "w1"}
+
+    def test_invalid_json(self, client):
+        r = client.post("/workflows/save", content=b"{", headers={"content-type": "application/json"})
+
+        assert r.status_code == 422
+
+    def test_missing_fields(self, client):
+        body = {k: v for k, v in SAVE.items() if k not in ("user_id", "nodes")}
+
+        locs = error_locs(client.post("/workflows/save", json=body))
+
+        assert ("body", "user_id") in locs
+        assert ("body", "nodes") in locs
+
+    @pytest.mark.parametrize("path, body, loc", [
+        ("/workflows/execute", {**EXECUTE, "user_id": 1}, ("body", "user_id")),
+        ("/workflows/save", {**SAVE, "user_id": ["x"]}, ("body", "user_id")),
+        ("/workflows/save", {**SAVE, "metadata": None}, ("body", "metadata")),
+        ("/workflows/save", {**SAVE, "nodes": 5}, ("body", "nodes")),
+        ("/workflows/execute", {**EXECUTE, "edges": None}, ("body", "edges")),
+    ])
+    def test_wrong_field_types(self, client, path, body, loc):
+        assert loc in error_locs(client.post(path, json=body))
+
+    def test_non_object_nodes_and_edges(self, client):
+        body = {**EXECUTE, "nodes": [1], "edges": [EDGE, "x"]}
+
+        locs = error_locs(client.post("/workflows/execute", json=body))
+
+        assert locs == [("body", "nodes", 0), ("body", "edges", 1)]
+
+    def test_node_missing_key(self, client):
+        node = {k: v for k, v in NODE.items() if k != "nodeId"}
+
+        locs = error_locs(client.post("/workflows/execute", json={**EXECUTE, "nodes": [node]}))
+
+        assert locs == [("body", "nodes", 0, "nodeId")]
+
+    def test_edge_missing_key(self, client):
+        edge = {k: v for k, v in EDGE.items() if k != "sourceOutput"}
+
+        locs = error_locs(client.post("/workflows/save", json={**SAVE, "edges": [edge]}))
+
+        assert locs == [("body", "edges", 0, "sourceOutput")]
+
+
+# =============================================================================
+# Skills in the /execute payload
+# =============================================================================
+
+SKILL = """---
+skill_id: echo-node
+name: Echo Node
+description: Echoes its input
+type: python-wasm
+execution_mode: browser-wasm
+category: general
+tags: ["test"]
+---
+
+# Echo
+
+```python
+def execute(inputs):
+    return {"out": inputs}
+```
+"""
+
+
+def execute_body(user_id):
+    node = {**NODE, "skillId": "echo-node"}
+    return {**EXECUTE, "user_id": user_id, "nodes": [node], "edges": []}
+
+
+class TestExecuteSkills:
+
+    def test_user_skill_included(self, client):
+        client.volume_manager.get_user_volume("alice").write_skill("echo-node", SKILL)
+
+        r = client.post("/workflows/execute", json=execute_body("alice"))
+
+        assert r.status_code == 200
+        assert "def execute" in r.json()["payload"]["skills"]["echo-node"]["code"]
+
+    def test_other_users_skill_not_included(self, client):
+        client.volume_manager.get_user_volume("alice").write_skill("echo-node", SKILL)
+        client.volume_manager.get_user_volume("bob")
+        assert client.post("/workflows/execute", json=execute_body("alice")).status_code == 200
+
+        r = client.post("/workflows/execute", json=execute_body("bob"))
+
+        assert r.status_code == 200
+        assert r.json()["payload"]["skills"] == {}
+
+    def test_new_skill_picked_up_within_ttl(self, client):
+        volume = client.volume_manager.get_user_volume("alice")
+        assert client.post("/workflows/execute", json=execute_body("alice")).json()["payload"]["skills"] == {}
+
+        volume.write_skill("echo-node", SKILL)
+        r = client.post("/workflows/execute", json=execute_body("alice"))
+
+        assert list(r.json()["payload"]["skills"]) == ["echo-node"]